@@ -1,11 +1,19 @@
 """GL.iNet Router Integration for Home Assistant."""
 import logging
+from datetime import timedelta
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.const import Platform
+from homeassistant.helpers.event import async_track_time_interval
 
-from .const import DOMAIN
+from .aggregate import async_setup_fleet_aggregator, async_unload_fleet_aggregator
+from .burst import BurstPoller, async_get_burst_pollers, register_burst_services
+from .const import CONF_HIGH_RES_SAMPLING, DOMAIN, ENDPOINT_PROBE_INTERVAL
 from .coordinator import GLiNetDataUpdateCoordinator
+from .fleet import async_register_fleet_services
+from .sampling import HighResolutionSampler
+from .websocket import async_register_websocket_commands
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -16,21 +24,62 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up GL.iNet from a config entry."""
     coordinator = GLiNetDataUpdateCoordinator(hass, entry)
     
-    await coordinator.async_config_entry_first_refresh()
+    try:
+        if len(coordinator.api.endpoints) > 1:
+            # Start on the fastest path, then keep measuring all of them
+            await coordinator.async_probe_endpoints()
+            entry.async_on_unload(async_track_time_interval(
+                hass, coordinator.async_probe_endpoints, timedelta(seconds=ENDPOINT_PROBE_INTERVAL)
+            ))
+        
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        # Each setup retry builds a new coordinator with a pool of its own
+        coordinator.executor.shutdown()
+        raise
+    
+    # While on battery, a single status read per base interval watches for the charger
+    entry.async_on_unload(async_track_time_interval(
+        hass, coordinator.async_check_power_source, coordinator.base_update_interval
+    ))
     
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
+    async_setup_fleet_aggregator(hass, entry)
     
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     
+    async_register_fleet_services(hass)
+    async_register_websocket_commands(hass)
+    
+    burst_poller = BurstPoller(hass, coordinator)
+    async_get_burst_pollers(hass)[entry.entry_id] = burst_poller
+    register_burst_services(hass)
+    entry.async_on_unload(burst_poller.async_stop)
+    
+    if entry.options.get(CONF_HIGH_RES_SAMPLING):
+        sampler = HighResolutionSampler(hass, coordinator, entry)
+        sampler.async_start()
+        entry.async_on_unload(sampler.async_stop)
+    
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    
     return True
 
 
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        async_unload_fleet_aggregator(hass, entry)
+        async_get_burst_pollers(hass).pop(entry.entry_id, None)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator.executor.shutdown()
     
     return unload_ok
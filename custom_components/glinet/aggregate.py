@@ -0,0 +1,291 @@
+"""Fleet-wide totals and summary sensors across all GL.iNet routers."""
+import heapq
+import logging
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set
+
+from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import (
+    CONF_FLEET_SUMMARY,
+    DATA_FLEET_AGGREGATOR,
+    DOMAIN,
+    FLEET_TOP_N,
+    MANUFACTURER,
+)
+from .coordinator import GLiNetDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RouterSummary(NamedTuple):
+    """The few figures of one router that feed the fleet totals."""
+
+    name: str
+    online: bool
+    clients: int
+    load: Optional[float]
+    wan_down: bool
+    vpn_down: bool
+
+
+def summarize(name: str, coordinator: GLiNetDataUpdateCoordinator) -> RouterSummary:
+    """Reduce a coordinator snapshot to a router summary."""
+    if not coordinator.last_update_success or not coordinator.data:
+        return RouterSummary(name, False, 0, None, False, False)
+
+    data = coordinator.data
+    system_status = data.get("system_status") or {}
+    client_counts = system_status.get("client") or [{}]
+    clients = (client_counts[0].get("wireless_total") or 0) + (client_counts[0].get("cable_total") or 0)
+    load_average = system_status.get("system", {}).get("load_average") or []
+    wan = next(
+        (iface for iface in system_status.get("network", []) if iface.get("interface") == "wan"),
+        None,
+    )
+    # A router only counts as VPN down when it has VPN profiles to be up on
+    vpn_down = bool(data.get("vpn_configs")) and (data.get("vpn_status") or {}).get("status") != 1
+    return RouterSummary(
+        name,
+        True,
+        clients,
+        load_average[0] if load_average else None,
+        wan is not None and not wan.get("online"),
+        vpn_down,
+    )
+
+
+class FleetAggregator:
+    """Fleet totals kept up to date from each coordinator's update notifications.
+
+    Every router contributes a small summary. When a coordinator updates, only
+    its summary is recomputed and the totals are adjusted by the difference;
+    summary sensors are told which metrics changed and skip state writes for
+    the rest.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize an empty fleet."""
+        self.hass = hass
+        self.summaries: Dict[str, RouterSummary] = {}
+        self.total_clients = 0
+        self.offline: Set[str] = set()
+        self.wan_down: Set[str] = set()
+        self.vpn_down: Set[str] = set()
+        self._unsubs: Dict[str, Callable[[], None]] = {}
+        self._listeners: List[Callable[[Set[str]], None]] = []
+        # Sensor platforms of the routers with the summary enabled; the fleet
+        # sensors exist once, on the owner, and move on when it unloads
+        self.sensor_hosts: Dict[str, AddEntitiesCallback] = {}
+        self.sensor_owner: Optional[str] = None
+
+    @callback
+    def async_add_router(self, entry_id: str, coordinator: GLiNetDataUpdateCoordinator) -> None:
+        """Start tracking a router."""
+        if entry_id in self._unsubs:
+            return
+
+        @callback
+        def handle_update() -> None:
+            entry = self.hass.config_entries.async_get_entry(entry_id)
+            self._async_update(entry_id, summarize(entry.title if entry else entry_id, coordinator))
+
+        self._unsubs[entry_id] = coordinator.async_add_listener(handle_update)
+        handle_update()
+
+    @callback
+    def async_remove_router(self, entry_id: str) -> None:
+        """Stop tracking a router and take it out of the totals."""
+        unsub = self._unsubs.pop(entry_id, None)
+        if unsub is not None:
+            unsub()
+        self._async_update(entry_id, None)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop tracking every router."""
+        for entry_id in list(self._unsubs):
+            self.async_remove_router(entry_id)
+
+    @callback
+    def async_add_listener(self, listener: Callable[[Set[str]], None]) -> Callable[[], None]:
+        """Call ``listener`` with the changed metrics after each change."""
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    @callback
+    def _async_update(self, entry_id: str, summary: Optional[RouterSummary]) -> None:
+        """Replace one router's summary and adjust the totals by the difference."""
+        previous = self.summaries.pop(entry_id, None)
+        if summary is not None:
+            self.summaries[entry_id] = summary
+        if summary == previous:
+            return
+
+        changed: Set[str] = set()
+        old_clients = previous.clients if previous else 0
+        new_clients = summary.clients if summary else 0
+        if new_clients != old_clients:
+            self.total_clients += new_clients - old_clients
+            changed.add("clients")
+        if (previous and previous.load) != (summary and summary.load):
+            changed.add("load")
+        if previous is None or summary is None or previous.name != summary.name:
+            changed.update(("routers", "clients", "load", "wan_down", "vpn_down"))
+
+        for metric, routers, flag in (
+            ("routers", self.offline, lambda s: not s.online),
+            ("wan_down", self.wan_down, lambda s: s.wan_down),
+            ("vpn_down", self.vpn_down, lambda s: s.vpn_down),
+        ):
+            member = summary is not None and flag(summary)
+            if member and entry_id not in routers:
+                routers.add(entry_id)
+                changed.add(metric)
+            elif not member and entry_id in routers:
+                routers.discard(entry_id)
+                changed.add(metric)
+
+        if changed:
+            for listener in list(self._listeners):
+                listener(changed)
+
+    def names(self, entry_ids: Set[str]) -> List[str]:
+        """Return the sorted router names of a set of entries."""
+        return sorted(self.summaries[entry_id].name for entry_id in entry_ids if entry_id in self.summaries)
+
+    def top(self, metric: str, count: int = FLEET_TOP_N) -> List[Dict[str, Any]]:
+        """Return the routers with the highest value of a summary metric."""
+        ranked = heapq.nlargest(
+            count,
+            (summary for summary in self.summaries.values() if getattr(summary, metric) is not None),
+            key=lambda summary: getattr(summary, metric),
+        )
+        return [{"router": summary.name, metric: getattr(summary, metric)} for summary in ranked]
+
+
+@callback
+def async_get_fleet_aggregator(hass: HomeAssistant) -> Optional[FleetAggregator]:
+    """Return the fleet aggregator, if a router has the fleet summary enabled."""
+    return hass.data.get(DATA_FLEET_AGGREGATOR)
+
+
+@callback
+def async_setup_fleet_aggregator(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Track a router in the fleet totals, starting the aggregator if enabled."""
+    aggregator = async_get_fleet_aggregator(hass)
+    if aggregator is None:
+        if not entry.options.get(CONF_FLEET_SUMMARY):
+            return
+        aggregator = hass.data[DATA_FLEET_AGGREGATOR] = FleetAggregator(hass)
+        # Routers set up before the summary was enabled
+        for entry_id, coordinator in hass.data.get(DOMAIN, {}).items():
+            aggregator.async_add_router(entry_id, coordinator)
+    aggregator.async_add_router(entry.entry_id, hass.data[DOMAIN][entry.entry_id])
+
+
+@callback
+def async_unload_fleet_aggregator(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Drop a router from the fleet totals, stopping the aggregator when unused."""
+    aggregator = async_get_fleet_aggregator(hass)
+    if aggregator is None:
+        return
+    aggregator.async_remove_router(entry.entry_id)
+    aggregator.sensor_hosts.pop(entry.entry_id, None)
+    if not aggregator.sensor_hosts:
+        aggregator.async_shutdown()
+        hass.data.pop(DATA_FLEET_AGGREGATOR)
+        return
+    if aggregator.sensor_owner == entry.entry_id:
+        # The sensors went with the owner's platform; recreate them elsewhere
+        _async_add_fleet_sensors(aggregator, next(iter(aggregator.sensor_hosts)))
+
+
+FLEET_SENSORS = {
+    "fleet_routers_online": ("Fleet Routers Online", "mdi:router-network", "routers"),
+    "fleet_clients": ("Fleet Clients", "mdi:devices", "clients"),
+    "fleet_highest_load": ("Fleet Highest Load", "mdi:speedometer", "load"),
+    "fleet_wan_down": ("Fleet WAN Down", "mdi:wan", "wan_down"),
+    "fleet_vpn_down": ("Fleet VPN Down", "mdi:vpn", "vpn_down"),
+}
+
+
+class GLiNetFleetSensor(SensorEntity):
+    """Summary sensor over every GL.iNet router."""
+
+    _attr_should_poll = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, aggregator: FleetAggregator, key: str) -> None:
+        """Initialize the fleet sensor."""
+        self._aggregator = aggregator
+        self._key = key
+        name, icon, self._metric = FLEET_SENSORS[key]
+        self._attr_name = name
+        self._attr_icon = icon
+        self._attr_unique_id = f"{DOMAIN}_{key}"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, "fleet")},
+            "name": "GL.iNet Fleet",
+            "manufacturer": MANUFACTURER,
+            "model": "Fleet Summary",
+        }
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to fleet changes."""
+        self.async_on_remove(self._aggregator.async_add_listener(self._handle_fleet_change))
+
+    @callback
+    def _handle_fleet_change(self, changed: Set[str]) -> None:
+        """Write state only when this sensor's metric changed."""
+        if self._metric in changed:
+            self.async_write_ha_state()
+
+    @property
+    def native_value(self) -> Any:
+        """Return the state of the sensor."""
+        aggregator = self._aggregator
+        if self._metric == "routers":
+            return len(aggregator.summaries) - len(aggregator.offline)
+        if self._metric == "clients":
+            return aggregator.total_clients
+        if self._metric == "load":
+            top = aggregator.top("load", 1)
+            return top[0]["load"] if top else None
+        if self._metric == "wan_down":
+            return len(aggregator.wan_down)
+        return len(aggregator.vpn_down)
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        """Return the state attributes."""
+        aggregator = self._aggregator
+        if self._metric == "routers":
+            return {"total": len(aggregator.summaries), "offline": aggregator.names(aggregator.offline)}
+        if self._metric in ("clients", "load"):
+            return {"top_routers": aggregator.top(self._metric)}
+        if self._metric == "wan_down":
+            return {"routers": aggregator.names(aggregator.wan_down)}
+        return {"routers": aggregator.names(aggregator.vpn_down)}
+
+
+@callback
+def async_setup_fleet_sensors(
+    hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
+) -> None:
+    """Offer a router with the summary enabled as host of the fleet sensors."""
+    aggregator = async_get_fleet_aggregator(hass)
+    if aggregator is None or not entry.options.get(CONF_FLEET_SUMMARY):
+        return
+    aggregator.sensor_hosts[entry.entry_id] = async_add_entities
+    if aggregator.sensor_owner is None:
+        _async_add_fleet_sensors(aggregator, entry.entry_id)
+
+
+@callback
+def _async_add_fleet_sensors(aggregator: FleetAggregator, entry_id: str) -> None:
+    """Add the fleet sensors, which are unique across the domain, to one router."""
+    aggregator.sensor_owner = entry_id
+    aggregator.sensor_hosts[entry_id](GLiNetFleetSensor(aggregator, key) for key in FLEET_SENSORS)
@@ -2,25 +2,292 @@
 import hashlib
 import json
 import logging
+import socket
+import ssl
 import subprocess
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Dict, List, Optional, Set
+from urllib.parse import urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .cache import ResponseCache, SingleFlight
+from .const import (
+    ENDPOINT_CONNECT_TIMEOUT,
+    ENDPOINT_PROBE_TIMEOUT,
+    RATE_LIMIT_BURST,
+    RATE_LIMIT_MAX_WAIT,
+    RATE_LIMIT_RATE,
+    REQUEST_TIMEOUT,
+)
+from .profiling import RefreshTracer
+from .ratelimit import PRIORITY_HIGH, PRIORITY_LOW, PRIORITY_WRITE, RouterRateLimiter
+from .records import VPNProfile
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def json_dumps(data: Any) -> bytes:
+    """Encode a request body, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+def json_loads(content: bytes) -> Any:
+    """Decode a response body, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+# Slow-changing detail reads that are dropped first when the router is busy
+LOW_PRIORITY_READS = {
+    ("system", "get_info"),
+    ("system", "disk_info"),
+    ("system", "get_timezone_config"),
+    ("system", "get_security_policy"),
+    ("system", "get_unixtime"),
+    ("firewall", "get_zone_list"),
+    ("wg-server", "get_config"),
+    ("wifi", "get_config"),
+}
+
+# Reads whose method name does not start with get_
+OTHER_READS = {
+    ("system", "check_firmware_online"),
+}
+
+
+# Seconds a read response is served from cache; other reads use DEFAULT_CACHE_TTL.
+# Every TTL stays below the refresh interval, so each refresh reads fresh
+# state and the cache only serves the burst poller, the sampler and services
+# in between.
+CACHE_TTLS = {
+    ("system", "get_info"): 20,
+    ("system", "disk_info"): 20,
+    ("system", "get_timezone_config"): 20,
+    ("system", "get_security_policy"): 20,
+    ("system", "get_unixtime"): 0,
+    ("system", "check_firmware_online"): 0,
+    ("firewall", "get_zone_list"): 20,
+    # Raw responses carry the WireGuard private key and WiFi passphrases,
+    # which must not outlive their projection into records
+    ("wg-server", "get_config"): 0,
+    ("wifi", "get_config"): 0,
+    ("wg-client", "get_all_config_list"): 20,
+    ("ovpn-client", "get_all_config_list"): 20,
+}
+# Long enough to collapse back-to-back reads, short enough for burst polling
+DEFAULT_CACHE_TTL = 0.5
+
+# Services whose cached reads a write to the key service makes stale; a
+# write to a service not listed here only invalidates that service. Starting
+# one VPN client tunnel stops the other kind, and a reboot changes everything.
+CACHE_INVALIDATES = {
+    "wg-client": ("wg-client", "ovpn-client"),
+    "ovpn-client": ("wg-client", "ovpn-client"),
+    "system": None,
+}
+
+
+def is_read(service: str, method: str) -> bool:
+    """Return true for RPC methods that do not change router state."""
+    return (
+        method.startswith("get_")
+        or (service, method) in LOW_PRIORITY_READS
+        or (service, method) in OTHER_READS
+    )
+
+
+def call_priority(service: str, method: str) -> int:
+    """Return the rate limiter priority of an RPC method."""
+    if (service, method) in LOW_PRIORITY_READS:
+        return PRIORITY_LOW
+    if is_read(service, method):
+        return PRIORITY_HIGH
+    return PRIORITY_WRITE
+
+
+class FingerprintAdapter(HTTPAdapter):
+    """Transport adapter that trusts exactly one certificate, by SHA-256 fingerprint.
+
+    GL.iNet routers ship a self-signed certificate, so it is pinned instead of
+    checked against a CA. Pooled connections are kept alive between calls,
+    which spares the router's slow CPU a TLS handshake per request.
+    """
+
+    def __init__(self, fingerprint: str, **kwargs: Any) -> None:
+        """Initialize the adapter."""
+        self.fingerprint = fingerprint
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        """Create the pool manager with fingerprint verification."""
+        kwargs["assert_fingerprint"] = self.fingerprint
+        super().init_poolmanager(*args, **kwargs)
+
+
+def fetch_certificate_fingerprint(host: str, timeout: float = 10) -> str:
+    """Return the SHA-256 fingerprint of the certificate a router presents."""
+    if host.count(":") > 1 and not host.startswith("["):
+        # A bare IPv6 address, whose colons are not a port separator
+        hostname, port = host, None
+    else:
+        parts = urlsplit(f"//{host}")
+        hostname, port = parts.hostname or host, parts.port
+    context = ssl.create_default_context()
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    with socket.create_connection((hostname, port or 443), timeout=timeout) as sock:
+        with context.wrap_socket(sock, server_hostname=hostname) as tls_sock:
+            certificate = tls_sock.getpeercert(binary_form=True)
+    digest = hashlib.sha256(certificate).hexdigest()
+    return ":".join(digest[i:i + 2] for i in range(0, len(digest), 2))
+
+
+def url_host(host: str) -> str:
+    """Return a host as written in a URL, with IPv6 literals in brackets."""
+    if host.count(":") > 1 and not host.startswith("["):
+        return f"[{host}]"
+    return host
+
+
+def parse_hosts(text: str) -> List[str]:
+    """Parse a comma or whitespace separated list of router addresses."""
+    return [host for host in text.replace(",", " ").split() if host]
+
+
 class GLiNetAPI:
     """API client for GL.iNet routers."""
 
-    def __init__(self, host: str, username: str, password: str) -> None:
+    def __init__(
+        self,
+        host: str,
+        username: str,
+        password: str,
+        use_https: bool = False,
+        cert_fingerprint: Optional[str] = None,
+        additional_hosts: Optional[List[str]] = None,
+    ) -> None:
         """Initialize the API client."""
         self.host = host
         self.username = username
         self.password = password
         self.sid: Optional[str] = None
+        self.scheme = "https" if use_https else "http"
+        # Every address the router answers on; the sid is valid on all of them
+        self.endpoints = [host] + [other for other in additional_hosts or [] if other != host]
+        self.active_endpoint = host
+        self.endpoint_rtt: Dict[str, Optional[float]] = {endpoint: None for endpoint in self.endpoints}
         self.session = requests.Session()
         self.session.timeout = 10
+        if use_https and cert_fingerprint:
+            # The pinned fingerprint replaces CA verification
+            self.session.verify = False
+            self.session.mount("https://", FingerprintAdapter(cert_fingerprint))
+        self.rate_limiter = RouterRateLimiter(RATE_LIMIT_RATE, RATE_LIMIT_BURST, RATE_LIMIT_MAX_WAIT)
+        self.cache = ResponseCache()
+        self.single_flight = SingleFlight()
+        # Set while a refresh trace is captured
+        self.tracer: Optional[RefreshTracer] = None
+
+    @property
+    def url(self) -> str:
+        """Return the RPC URL of the active endpoint."""
+        return self._url_for(self.active_endpoint)
+
+    def _url_for(self, endpoint: str) -> str:
+        """Return the RPC URL of an endpoint."""
+        return f"{self.scheme}://{url_host(endpoint)}/rpc"
+
+    def _post(self, payload: Dict[str, Any], idempotent: bool = True) -> requests.Response:
+        """POST a JSON-RPC payload, failing over if the active endpoint is unreachable.
+
+        A non-idempotent call only fails over when it never reached the
+        router; after a read timeout it may already have run, so resending it
+        elsewhere could apply it twice.
+        """
+        body = json_dumps(payload)
+        retry_on = (
+            (requests.ConnectionError, requests.Timeout)
+            if idempotent
+            else (requests.ConnectionError, requests.ConnectTimeout)
+        )
+        tried = set()
+        while True:
+            endpoint = self.active_endpoint
+            tried.add(endpoint)
+            try:
+                return self.session.post(
+                    self._url_for(endpoint),
+                    data=body,
+                    headers={"Content-Type": "application/json"},
+                    timeout=(ENDPOINT_CONNECT_TIMEOUT, REQUEST_TIMEOUT),
+                )
+            except retry_on:
+                fallback = self._best_endpoint(exclude=tried)
+                if fallback is None:
+                    raise
+                _LOGGER.warning("Router endpoint %s unreachable, failing over to %s", endpoint, fallback)
+                self.endpoint_rtt[endpoint] = None
+                self.active_endpoint = fallback
+
+    def _best_endpoint(self, exclude: Set[str] = frozenset()) -> Optional[str]:
+        """Return the endpoint with the lowest known RTT, else the first untried one."""
+        candidates = [endpoint for endpoint in self.endpoints if endpoint not in exclude]
+        if not candidates:
+            return None
+        measured = [endpoint for endpoint in candidates if self.endpoint_rtt[endpoint] is not None]
+        if measured:
+            return min(measured, key=lambda endpoint: self.endpoint_rtt[endpoint])
+        return candidates[0]
+
+    def probe_endpoints(self) -> Dict[str, Optional[float]]:
+        """Measure the RTT of every endpoint and switch to a clearly faster one.
+
+        The probe is an unauthenticated ``challenge`` call. An endpoint that
+        does not answer gets no RTT; the active endpoint is only replaced when
+        it is down or another one is at least 20% faster, so two similar paths
+        do not flap.
+        """
+        payload = json_dumps({
+            "jsonrpc": "2.0",
+            "method": "challenge",
+            "params": {"username": self.username},
+            "id": 0
+        })
+        for endpoint in self.endpoints:
+            started = time.monotonic()
+            try:
+                response = self.session.post(
+                    self._url_for(endpoint),
+                    data=payload,
+                    headers={"Content-Type": "application/json"},
+                    timeout=ENDPOINT_PROBE_TIMEOUT,
+                )
+                response.raise_for_status()
+                healthy = "result" in json_loads(response.content)
+            except Exception:  # pylint: disable=broad-except
+                healthy = False
+            self.endpoint_rtt[endpoint] = (
+                round((time.monotonic() - started) * 1000, 1) if healthy else None
+            )
+
+        best = self._best_endpoint()
+        active_rtt = self.endpoint_rtt[self.active_endpoint]
+        best_rtt = self.endpoint_rtt.get(best)
+        if best_rtt is not None and best != self.active_endpoint and (
+            active_rtt is None or best_rtt < active_rtt * 0.8
+        ):
+            _LOGGER.info("Switching router endpoint from %s to %s", self.active_endpoint, best)
+            self.active_endpoint = best
+        return dict(self.endpoint_rtt)
 
     def authenticate(self) -> bool:
         """Authenticate with the router."""
@@ -33,14 +300,10 @@ class GLiNetAPI:
                 "id": 0
             }
             
-            response = self.session.post(
-                f"http://{self.host}/rpc",
-                json=challenge_data,
-                headers={"Content-Type": "application/json"}
-            )
+            response = self._post(challenge_data)
             response.raise_for_status()
             
-            challenge_result = response.json()
+            challenge_result = json_loads(response.content)
             if "result" not in challenge_result:
                 _LOGGER.error("No result in challenge response")
                 return False
@@ -69,14 +332,10 @@ class GLiNetAPI:
                 "id": 0
             }
             
-            response = self.session.post(
-                f"http://{self.host}/rpc",
-                json=login_data,
-                headers={"Content-Type": "application/json"}
-            )
+            response = self._post(login_data)
             response.raise_for_status()
             
-            login_result = response.json()
+            login_result = json_loads(response.content)
             if "result" in login_result and "sid" in login_result["result"]:
                 self.sid = login_result["result"]["sid"]
                 _LOGGER.debug("Authentication successful")
@@ -188,6 +447,35 @@ class GLiNetAPI:
         if params is None:
             params = {}
             
+        if not is_read(service, method):
+            return self._send_rpc(service, method, params)
+            
+        cache_key = (service, method, json.dumps(params, sort_keys=True))
+        generation = self.cache.generation
+        found, result = self.cache.lookup(cache_key)
+        if not found:
+            result = self.single_flight.do(
+                cache_key, lambda: self._send_rpc(service, method, params)
+            )
+            if result is None:
+                return None
+            ttl = CACHE_TTLS.get((service, method), DEFAULT_CACHE_TTL)
+            if ttl:
+                self.cache.store(cache_key, result, ttl, generation)
+        # Callers may replace top-level keys, so each gets its own dict
+        return dict(result) if isinstance(result, dict) else result
+
+    def _send_rpc(self, service: str, method: str, params: Dict) -> Optional[Dict]:
+        """Send an RPC call within the rate limit and return its result."""
+        tracer = self.tracer
+        if tracer is not None:
+            started = time.perf_counter()
+        if not self.rate_limiter.acquire(call_priority(service, method)):
+            _LOGGER.debug("Router busy, dropped %s.%s", service, method)
+            return None
+        if tracer is not None:
+            tracer.add_span("rpc.wait", time.perf_counter() - started, f"{service}.{method}")
+            
         data = {
             "jsonrpc": "2.0",
             "method": "call",
@@ -196,15 +484,20 @@ class GLiNetAPI:
         }
         
         try:
-            response = self.session.post(
-                f"http://{self.host}/rpc",
-                json=data,
-                headers={"Content-Type": "application/json"}
-            )
+            if tracer is not None:
+                started = time.perf_counter()
+            response = self._post(data, is_read(service, method))
             response.raise_for_status()
+            if tracer is not None:
+                tracer.add_span("rpc.send", time.perf_counter() - started, f"{service}.{method}")
+                started = time.perf_counter()
             
-            result = response.json()
+            result = json_loads(response.content)
+            if tracer is not None:
+                tracer.add_span("rpc.decode", time.perf_counter() - started, f"{service}.{method}")
             if "result" in result:
+                if not is_read(service, method):
+                    self.cache.invalidate(CACHE_INVALIDATES.get(service, (service,)))
                 return result["result"]
             else:
                 _LOGGER.error("No result in RPC response: %s", result)
@@ -236,7 +529,7 @@ class GLiNetAPI:
             "domain": None
         }
 
-    def get_vpn_configs(self, vpn_type: str) -> List[Dict]:
+    def get_vpn_configs(self, vpn_type: str) -> List[VPNProfile]:
         """Get all VPN configurations for a specific type."""
         result = self._make_rpc_call(f"{vpn_type}-client", "get_all_config_list")
         if not result or "config_list" not in result:
@@ -249,26 +542,26 @@ class GLiNetAPI:
             
             if vpn_type == "wg" and "peers" in group:
                 for peer in group["peers"]:
-                    configs.append({
+                    configs.append(VPNProfile({
                         "name": peer.get("name"),
                         "group_id": group_id,
                         "group_name": group_name,
                         "peer_id": peer.get("peer_id"),
                         "type": "wg"
-                    })
+                    }))
             elif vpn_type == "ovpn" and "clients" in group:
                 for client in group["clients"]:
-                    configs.append({
+                    configs.append(VPNProfile({
                         "name": client.get("name"),
                         "group_id": group_id,
                         "group_name": group_name,
                         "client_id": client.get("client_id"),
                         "type": "ovpn"
-                    })
+                    }))
                     
         return configs
 
-    def get_all_vpn_configs(self) -> List[Dict]:
+    def get_all_vpn_configs(self) -> List[VPNProfile]:
         """Get all VPN configurations."""
         configs = []
         configs.extend(self.get_vpn_configs("wg"))
@@ -0,0 +1,183 @@
+"""On-demand burst polling of a few GL.iNet endpoints for troubleshooting."""
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import voluptuous as vol
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+
+from .const import (
+    BURST_DEFAULT_DURATION,
+    BURST_DEFAULT_INTERVAL,
+    BURST_MAX_DURATION,
+    BURST_MAX_LOAD_PER_CORE,
+    BURST_MIN_INTERVAL,
+    DATA_BURST_POLLERS,
+    DOMAIN,
+)
+from .coordinator import GLiNetDataUpdateCoordinator
+from .fleet import async_resolve_targets
+
+_LOGGER = logging.getLogger(__name__)
+
+BURST_ENDPOINTS = ["wan_status", "vpn_status", "load"]
+
+BURST_TARGET_SCHEMA = vol.Schema(cv.ENTITY_SERVICE_FIELDS)
+
+START_BURST_POLLING_SCHEMA = vol.Schema(
+    {
+        **cv.ENTITY_SERVICE_FIELDS,
+        vol.Optional("endpoints"): vol.All(cv.ensure_list, [vol.In(BURST_ENDPOINTS)]),
+        vol.Optional("interval", default=BURST_DEFAULT_INTERVAL): vol.All(
+            vol.Coerce(float), vol.Range(min=BURST_MIN_INTERVAL, max=10)
+        ),
+        vol.Optional("duration", default=BURST_DEFAULT_DURATION): vol.All(
+            vol.Coerce(float), vol.Range(min=10, max=BURST_MAX_DURATION)
+        ),
+    }
+)
+
+
+class BurstPoller:
+    """Poll a subset of endpoints at high frequency for a bounded time.
+
+    Each burst has its own fetch plan with only the calls the chosen
+    endpoints need. Results are merged into the coordinator snapshot without
+    rescheduling the regular refresh, and the burst stops on its own at the
+    deadline or as soon as the router's load per core crosses the limit.
+    """
+
+    def __init__(self, hass: HomeAssistant, coordinator: GLiNetDataUpdateCoordinator) -> None:
+        """Initialize the burst poller."""
+        self.hass = hass
+        self.coordinator = coordinator
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def active(self) -> bool:
+        """Return true while a burst is running."""
+        return self._task is not None and not self._task.done()
+
+    def _fetch_plan(self, endpoints: List[str]) -> List[Tuple[str, Callable[[], Any]]]:
+        """Return the (snapshot key, api call) pairs needed for the endpoints."""
+        api = self.coordinator.api
+        calls = {
+            "wan_status": ("system_status", api.get_system_status),
+            "vpn_status": ("vpn_status", api.get_active_vpn),
+            "load": ("load_info", api.get_load),
+        }
+        plan = {}
+        for endpoint in endpoints:
+            key, func = calls[endpoint]
+            plan[key] = func
+        return list(plan.items())
+
+    @callback
+    def async_start(self, endpoints: List[str], interval: float, duration: float) -> None:
+        """Start a burst, replacing any running one."""
+        load = self.coordinator.load_per_core()
+        if load is not None and load > BURST_MAX_LOAD_PER_CORE:
+            raise HomeAssistantError(
+                f"Router load {load:.2f} per core is above {BURST_MAX_LOAD_PER_CORE}; not starting burst polling"
+            )
+
+        self.async_stop()
+        plan = self._fetch_plan(endpoints)
+        self._task = self.hass.async_create_background_task(
+            self._async_run(plan, max(interval, BURST_MIN_INTERVAL), min(duration, BURST_MAX_DURATION)),
+            f"{DOMAIN} burst polling",
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel the running burst, if any."""
+        if self.active:
+            self._task.cancel()
+        self._task = None
+
+    async def _async_run(
+        self, plan: List[Tuple[str, Callable[[], Any]]], interval: float, duration: float
+    ) -> None:
+        """Run the burst loop until the deadline."""
+        coordinator = self.coordinator
+        deadline = time.monotonic() + duration
+        _LOGGER.info("Burst polling %s every %ss for %ss", [key for key, _ in plan], interval, duration)
+
+        try:
+            while time.monotonic() < deadline:
+                started = time.monotonic()
+                results = {}
+                for key, func in plan:
+                    result = await self.coordinator.async_add_api_job(func)
+                    if result is not None:
+                        results[key] = result
+
+                if not results:
+                    await asyncio.sleep(interval)
+                    continue
+                coordinator.merge_partial_data(results)
+
+                load = self.coordinator.load_per_core()
+                if load is not None and load > BURST_MAX_LOAD_PER_CORE:
+                    _LOGGER.warning("Stopping burst polling: router load %.2f per core", load)
+                    break
+
+                await asyncio.sleep(max(0.0, interval - (time.monotonic() - started)))
+        except asyncio.CancelledError:
+            # Stopped or unloading; the coordinator may be going away
+            _LOGGER.info("Burst polling cancelled")
+            raise
+
+        _LOGGER.info("Burst polling finished")
+        # Bring every other entity back in line with the regular data
+        self.hass.async_create_task(coordinator.async_request_refresh())
+
+
+@callback
+def async_get_burst_pollers(hass: HomeAssistant) -> Dict[str, BurstPoller]:
+    """Return the burst poller of every loaded router, by config entry id."""
+    return hass.data.setdefault(DATA_BURST_POLLERS, {})
+
+
+@callback
+def register_burst_services(hass: HomeAssistant) -> None:
+    """Register burst polling services, once for all routers."""
+    if hass.services.has_service(DOMAIN, "start_burst_polling"):
+        return
+
+    def target_pollers(call: ServiceCall) -> List[BurstPoller]:
+        pollers = async_get_burst_pollers(hass)
+        return [pollers[entry_id] for entry_id in async_resolve_targets(hass, call) if entry_id in pollers]
+
+    async def handle_start_burst_polling(call: ServiceCall) -> None:
+        """Handle start burst polling service."""
+        refused = []
+        for poller in target_pollers(call):
+            try:
+                poller.async_start(
+                    call.data.get("endpoints") or BURST_ENDPOINTS,
+                    call.data["interval"],
+                    call.data["duration"],
+                )
+            except HomeAssistantError as exc:
+                refused.append(f"{poller.coordinator.config_entry.title}: {exc}")
+        if refused:
+            raise HomeAssistantError("; ".join(refused))
+
+    async def handle_stop_burst_polling(call: ServiceCall) -> None:
+        """Handle stop burst polling service."""
+        for poller in target_pollers(call):
+            if poller.active:
+                poller.async_stop()
+                # A cancelled burst leaves the refresh to whoever stopped it
+                await poller.coordinator.async_request_refresh()
+
+    hass.services.async_register(
+        DOMAIN, "start_burst_polling", handle_start_burst_polling, schema=START_BURST_POLLING_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, "stop_burst_polling", handle_stop_burst_polling, schema=BURST_TARGET_SCHEMA
+    )
@@ -0,0 +1,119 @@
+"""Short-lived cache and in-flight deduplication of GL.iNet RPC reads."""
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+CacheKey = Tuple[str, str, str]
+
+
+class ResponseCache:
+    """Read responses keyed by (service, method, params), each with its own TTL.
+
+    Calls run in executor threads, so the entries are guarded by a lock.
+    Writers invalidate every entry of the services they touch, which keeps a
+    refresh right after a write from seeing the state before it.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        """Initialize an empty cache."""
+        self._clock = clock
+        self._entries: Dict[CacheKey, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        # Bumped on every invalidation, so a read that was already in flight
+        # when a write landed does not store what it got back
+        self.generation = 0
+
+    def lookup(self, key: CacheKey) -> Tuple[bool, Any]:
+        """Return (True, response) for a fresh entry, else (False, None)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > self._clock():
+                    self.hits += 1
+                    return True, entry[1]
+                del self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def store(self, key: CacheKey, response: Any, ttl: float, generation: int) -> None:
+        """Keep a response for ``ttl`` seconds unless an invalidation happened since ``generation``."""
+        with self._lock:
+            if generation == self.generation:
+                self._entries[key] = (self._clock() + ttl, response)
+
+    def invalidate(self, services: Optional[Iterable[str]] = None) -> None:
+        """Drop the entries of the given services, or every entry."""
+        with self._lock:
+            if services is None:
+                self._entries.clear()
+            else:
+                services = set(services)
+                for key in [key for key in self._entries if key[0] in services]:
+                    del self._entries[key]
+            self.invalidations += 1
+            self.generation += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the hit and miss counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 3) if lookups else None,
+                "invalidations": self.invalidations,
+            }
+
+
+class SingleFlight:
+    """Share one in-flight call between every thread asking for the same key.
+
+    The first caller runs the call; callers arriving while it is in flight
+    wait for its result instead of sending the same request again.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with nothing in flight."""
+        self._calls: Dict[CacheKey, Future] = {}
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.shared = 0
+
+    def do(self, key: CacheKey, func: Callable[[], Any]) -> Any:
+        """Return the result of ``func``, or of the identical call already in flight."""
+        with self._lock:
+            self.calls += 1
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+            else:
+                self.shared += 1
+        if not leader:
+            return future.result()
+
+        try:
+            result = func()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    def stats(self) -> Dict[str, Any]:
+        """Return how many calls were served by another caller's request."""
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "shared": self.shared,
+                "dedup_ratio": round(self.shared / self.calls, 3) if self.calls else None,
+            }
@@ -1,16 +1,46 @@
 """Config flow for GL.iNet integration."""
+import asyncio
 import logging
 from typing import Any
 
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .api import GLiNetAPI
-from .const import CONF_HOST, DEFAULT_HOST, DEFAULT_USERNAME, DOMAIN
+from .api import GLiNetAPI, fetch_certificate_fingerprint
+from .const import (
+    CONF_ADDITIONAL_HOSTS,
+    CONF_CERT_FINGERPRINT,
+    CONF_CRITICAL_BATTERY_THRESHOLD,
+    CONF_DEADBANDS,
+    CONF_FLEET_SUMMARY,
+    CONF_HEARTBEAT_INTERVAL,
+    CONF_HIGH_RES_SAMPLING,
+    CONF_HOST,
+    CONF_LOW_BATTERY_THRESHOLD,
+    CONF_MIN_PUBLISH_INTERVAL,
+    CONF_RATE_WINDOW,
+    CONF_USE_HTTPS,
+    DEFAULT_CRITICAL_BATTERY_THRESHOLD,
+    DEFAULT_DISCOVERY_NETWORK,
+    DEFAULT_HEARTBEAT_INTERVAL,
+    DEFAULT_HOST,
+    DEFAULT_LOW_BATTERY_THRESHOLD,
+    DEFAULT_MIN_PUBLISH_INTERVAL,
+    DEFAULT_RATE_WINDOW,
+    DEFAULT_USERNAME,
+    DISCOVERY_CONCURRENCY,
+    DISCOVERY_MAX_HOSTS,
+    DISCOVERY_TIMEOUT,
+    DOMAIN,
+)
+from .discovery import async_discover_routers, network_hosts
+from .filters import parse_deadbands
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -19,15 +49,43 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
         vol.Required(CONF_HOST, default=DEFAULT_HOST): str,
         vol.Required(CONF_USERNAME, default=DEFAULT_USERNAME): str,
         vol.Required(CONF_PASSWORD): str,
+        vol.Optional(CONF_USE_HTTPS, default=False): bool,
+        vol.Optional(CONF_CERT_FINGERPRINT, default=""): str,
+    }
+)
+
+CONF_NETWORK = "network"
+CONF_ROUTERS = "routers"
+
+# Flow source of the further routers picked in one discovery flow
+SOURCE_DISCOVERED_ROUTER = "discovered_router"
+
+STEP_DISCOVER_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_NETWORK, default=DEFAULT_DISCOVERY_NETWORK): str,
+        vol.Required(CONF_USERNAME, default=DEFAULT_USERNAME): str,
+        vol.Required(CONF_PASSWORD): str,
     }
 )
 
 
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect."""
-    api = GLiNetAPI(data[CONF_HOST], data[CONF_USERNAME], data[CONF_PASSWORD])
-    
     try:
+        if data.get(CONF_USE_HTTPS) and not data.get(CONF_CERT_FINGERPRINT):
+            # Trust the certificate the router presents now, and only that one
+            data[CONF_CERT_FINGERPRINT] = await hass.async_add_executor_job(
+                fetch_certificate_fingerprint, data[CONF_HOST]
+            )
+        
+        api = GLiNetAPI(
+            data[CONF_HOST],
+            data[CONF_USERNAME],
+            data[CONF_PASSWORD],
+            data.get(CONF_USE_HTTPS, False),
+            data.get(CONF_CERT_FINGERPRINT) or None,
+        )
+        
         await hass.async_add_executor_job(api.authenticate)
         system_info = await hass.async_add_executor_job(api.get_system_info)
         
@@ -40,7 +98,7 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
             "mac": system_info.get("mac", "Unknown"),
         }
     except Exception as exc:
-        _LOGGER.exception("Unexpected exception")
+        # Logged by the caller; a network scan expects many of these
         raise CannotConnect from exc
 
 
@@ -49,16 +107,30 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    def __init__(self) -> None:
+        """Initialize the config flow."""
+        self._credentials: dict[str, Any] = {}
+        self._discovered: dict[str, dict[str, Any]] = {}
+        # Entry data of each discovered router, keyed by host
+        self._discovered_data: dict[str, dict[str, Any]] = {}
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Handle the initial step."""
+        return self.async_show_menu(step_id="user", menu_options=["manual", "discover"])
+
+    async def async_step_manual(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle a router entered by address."""
         errors: dict[str, str] = {}
         
         if user_input is not None:
             try:
                 info = await validate_input(self.hass, user_input)
             except CannotConnect:
+                _LOGGER.exception("Unable to connect to %s", user_input[CONF_HOST])
                 errors["base"] = "cannot_connect"
             except InvalidAuth:
                 errors["base"] = "invalid_auth"
@@ -72,8 +144,183 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 return self.async_create_entry(title=info["title"], data=user_input)
 
         return self.async_show_form(
-            step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
+            step_id="manual", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
+        )
+
+    async def async_step_discover(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Scan a network for routers that accept the given credentials."""
+        errors: dict[str, str] = {}
+        
+        if user_input is not None:
+            try:
+                hosts = network_hosts(user_input[CONF_NETWORK], DISCOVERY_MAX_HOSTS)
+            except ValueError:
+                errors[CONF_NETWORK] = "invalid_network"
+            else:
+                found = await async_discover_routers(
+                    async_get_clientsession(self.hass),
+                    hosts,
+                    DISCOVERY_CONCURRENCY,
+                    DISCOVERY_TIMEOUT,
+                )
+                self._credentials = {
+                    CONF_USERNAME: user_input[CONF_USERNAME],
+                    CONF_PASSWORD: user_input[CONF_PASSWORD],
+                }
+                await self._async_identify_routers(found)
+                if self._discovered:
+                    return await self.async_step_select()
+                errors["base"] = "no_routers_found"
+
+        return self.async_show_form(
+            step_id="discover", data_schema=STEP_DISCOVER_DATA_SCHEMA, errors=errors
+        )
+
+    async def _async_identify_routers(self, hosts: dict[str, bool]) -> None:
+        """Log in to each found router and keep the ones not configured yet."""
+        data = {
+            host: {CONF_HOST: host, **self._credentials, CONF_USE_HTTPS: https}
+            for host, https in hosts.items()
+        }
+        results = await asyncio.gather(
+            *(validate_input(self.hass, host_data) for host_data in data.values()),
+            return_exceptions=True,
+        )
+        configured = self._async_current_ids()
+        self._discovered = {}
+        self._discovered_data = {}
+        for host, info in zip(data, results):
+            if isinstance(info, Exception):
+                _LOGGER.debug("Found router %s but could not log in: %r", host, info.__cause__ or info)
+            elif info["mac"] not in configured:
+                self._discovered[host] = info
+                # Holds the certificate pinned during validation, if any
+                self._discovered_data[host] = data[host]
+
+    async def async_step_select(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Pick the discovered routers to add."""
+        if user_input is not None and user_input[CONF_ROUTERS]:
+            first, *others = user_input[CONF_ROUTERS]
+            for host in others:
+                # Each further router gets a flow and an entry of its own
+                self.hass.async_create_task(
+                    self.hass.config_entries.flow.async_init(
+                        DOMAIN,
+                        context={"source": SOURCE_DISCOVERED_ROUTER},
+                        data=self._discovered_data[host],
+                    )
+                )
+            info = self._discovered[first]
+            await self.async_set_unique_id(info["mac"])
+            self._abort_if_unique_id_configured()
+            return self.async_create_entry(
+                title=info["title"], data=self._discovered_data[first]
+            )
+
+        routers = {
+            host: f"{info['model']} ({info['mac']}) at {host}"
+            for host, info in self._discovered.items()
+        }
+        return self.async_show_form(
+            step_id="select",
+            data_schema=vol.Schema(
+                {vol.Required(CONF_ROUTERS, default=list(routers)): cv.multi_select(routers)}
+            ),
+        )
+
+    async def async_step_discovered_router(self, router_data: dict[str, Any]) -> FlowResult:
+        """Add a further router picked in a discovery flow."""
+        try:
+            info = await validate_input(self.hass, router_data)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.warning("Unable to connect to discovered router %s", router_data[CONF_HOST])
+            return self.async_abort(reason="cannot_connect")
+        await self.async_set_unique_id(info["mac"])
+        self._abort_if_unique_id_configured()
+        return self.async_create_entry(title=info["title"], data=router_data)
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> config_entries.OptionsFlow:
+        """Get the options flow for this handler."""
+        return OptionsFlowHandler(config_entry)
+
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle GL.iNet options."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize options flow."""
+        self.config_entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            try:
+                parse_deadbands(user_input.get(CONF_DEADBANDS, ""))
+            except ValueError:
+                errors[CONF_DEADBANDS] = "invalid_deadbands"
+            if user_input.get(
+                CONF_CRITICAL_BATTERY_THRESHOLD, DEFAULT_CRITICAL_BATTERY_THRESHOLD
+            ) > user_input.get(CONF_LOW_BATTERY_THRESHOLD, DEFAULT_LOW_BATTERY_THRESHOLD):
+                errors[CONF_CRITICAL_BATTERY_THRESHOLD] = "invalid_battery_thresholds"
+            if not errors:
+                return self.async_create_entry(title="", data=user_input)
+
+        options = self.config_entry.options
+        data_schema = vol.Schema(
+            {
+                vol.Optional(
+                    CONF_ADDITIONAL_HOSTS,
+                    default=options.get(CONF_ADDITIONAL_HOSTS, ""),
+                ): str,
+                vol.Optional(
+                    CONF_RATE_WINDOW,
+                    default=options.get(CONF_RATE_WINDOW, DEFAULT_RATE_WINDOW),
+                ): vol.All(vol.Coerce(int), vol.Range(min=10, max=3600)),
+                vol.Optional(
+                    CONF_MIN_PUBLISH_INTERVAL,
+                    default=options.get(CONF_MIN_PUBLISH_INTERVAL, DEFAULT_MIN_PUBLISH_INTERVAL),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+                vol.Optional(
+                    CONF_HEARTBEAT_INTERVAL,
+                    default=options.get(CONF_HEARTBEAT_INTERVAL, DEFAULT_HEARTBEAT_INTERVAL),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=1440)),
+                vol.Optional(
+                    CONF_DEADBANDS,
+                    default=options.get(CONF_DEADBANDS, ""),
+                ): str,
+                vol.Optional(
+                    CONF_HIGH_RES_SAMPLING,
+                    default=options.get(CONF_HIGH_RES_SAMPLING, False),
+                ): bool,
+                vol.Optional(
+                    CONF_FLEET_SUMMARY,
+                    default=options.get(CONF_FLEET_SUMMARY, False),
+                ): bool,
+                vol.Optional(
+                    CONF_LOW_BATTERY_THRESHOLD,
+                    default=options.get(CONF_LOW_BATTERY_THRESHOLD, DEFAULT_LOW_BATTERY_THRESHOLD),
+                ): vol.All(vol.Coerce(int), vol.Range(min=5, max=100)),
+                vol.Optional(
+                    CONF_CRITICAL_BATTERY_THRESHOLD,
+                    default=options.get(
+                        CONF_CRITICAL_BATTERY_THRESHOLD, DEFAULT_CRITICAL_BATTERY_THRESHOLD
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+            }
         )
+        return self.async_show_form(step_id="init", data_schema=data_schema, errors=errors)
 
 
 class CannotConnect(HomeAssistantError):
@@ -7,11 +7,110 @@ MANUFACTURER = "GL.iNet"
 CONF_HOST = "host"
 CONF_USERNAME = "username"
 CONF_PASSWORD = "password"
+CONF_USE_HTTPS = "use_https"
+CONF_CERT_FINGERPRINT = "cert_fingerprint"
+CONF_ADDITIONAL_HOSTS = "additional_hosts"
+CONF_RATE_WINDOW = "rate_window"
+CONF_DEADBANDS = "deadbands"
+CONF_MIN_PUBLISH_INTERVAL = "min_publish_interval"
+CONF_HEARTBEAT_INTERVAL = "heartbeat_interval"
+CONF_HIGH_RES_SAMPLING = "high_res_sampling"
+CONF_FLEET_SUMMARY = "fleet_summary"
+CONF_LOW_BATTERY_THRESHOLD = "low_battery_threshold"
+CONF_CRITICAL_BATTERY_THRESHOLD = "critical_battery_threshold"
 
 # Default values
 DEFAULT_HOST = "192.168.8.1"
 DEFAULT_USERNAME = "root"
 DEFAULT_SCAN_INTERVAL = 30
+DEFAULT_RATE_WINDOW = 120
+DEFAULT_MIN_PUBLISH_INTERVAL = 0
+DEFAULT_HEARTBEAT_INTERVAL = 10
+DEFAULT_LOW_BATTERY_THRESHOLD = 30
+DEFAULT_CRITICAL_BATTERY_THRESHOLD = 15
+
+# Default deadbands of noisy sensors as (value, is_percentage); a new value
+# is only written once it moves further than this from the last written one
+DEFAULT_DEADBANDS = {
+    "cpu_load_1min": (0.1, False),
+    "cpu_load_5min": (0.05, False),
+    "cpu_load_15min": (0.05, False),
+    "cpu_temperature": (1.0, False),
+    "memory_usage": (1.0, False),
+    "memory_free": (2.0, True),
+    "flash_usage": (0.5, False),
+    "flash_free": (1.0, True),
+    "battery_temperature": (1.0, False),
+}
+
+# Sliding windows (seconds) for per-client traffic and top talkers
+TRAFFIC_WINDOWS = {"5min": 300, "1h": 3600}
+DEFAULT_TOP_TALKERS = 5
+
+# High-resolution sampling into long-term statistics (seconds)
+HIGH_RES_SAMPLE_INTERVAL = 5
+HIGH_RES_FLUSH_INTERVAL = 300
+
+# Maximum number of firewall RPCs in flight during a sync
+FIREWALL_SYNC_CONCURRENCY = 4
+
+# Default number of routers a fleet service acts on at once
+FLEET_CONCURRENCY = 8
+
+# hass.data key of the fleet summary aggregator, and how many routers its top lists show
+DATA_FLEET_AGGREGATOR = f"{DOMAIN}_fleet_aggregator"
+FLEET_TOP_N = 5
+
+# hass.data key of the burst poller of each router, by config entry id
+DATA_BURST_POLLERS = f"{DOMAIN}_burst_pollers"
+
+# hass.data key of the sensors of each router, by config entry id, for get_router_details
+DATA_ROUTER_SENSORS = f"{DOMAIN}_router_sensors"
+
+# Default and largest page of the websocket table commands
+WEBSOCKET_PAGE_SIZE = 100
+WEBSOCKET_MAX_PAGE_SIZE = 1000
+
+# Power profiles of battery routers and how much each stretches polling
+POWER_PROFILE_MAINS = "mains"
+POWER_PROFILE_BATTERY = "battery"
+POWER_PROFILE_LOW_BATTERY = "low_battery"
+POWER_PROFILE_CRITICAL_BATTERY = "critical_battery"
+POWER_PROFILE_INTERVAL_FACTORS = {
+    POWER_PROFILE_MAINS: 1,
+    POWER_PROFILE_BATTERY: 2,
+    POWER_PROFILE_LOW_BATTERY: 4,
+    POWER_PROFILE_CRITICAL_BATTERY: 10,
+}
+
+# On-demand burst polling
+BURST_DEFAULT_INTERVAL = 2
+BURST_MIN_INTERVAL = 1
+BURST_DEFAULT_DURATION = 60
+BURST_MAX_DURATION = 600
+# Bursts are refused, or stopped, above this 1 minute load average per core
+BURST_MAX_LOAD_PER_CORE = 0.8
+
+# Router-protective RPC rate limit: sustained calls per second at idle, burst
+# size, and how long high priority reads and writes may queue (seconds)
+RATE_LIMIT_RATE = 2
+RATE_LIMIT_BURST = 25
+RATE_LIMIT_MAX_WAIT = 10
+
+# Worker threads of each router's own RPC thread pool
+ROUTER_EXECUTOR_WORKERS = 3
+
+# Network scan in the config flow
+DEFAULT_DISCOVERY_NETWORK = "192.168.8.0/24"
+DISCOVERY_CONCURRENCY = 64
+DISCOVERY_TIMEOUT = 1.5
+DISCOVERY_MAX_HOSTS = 1024
+
+# RPC timeouts, and background probing of alternative router addresses (seconds)
+REQUEST_TIMEOUT = 10
+ENDPOINT_CONNECT_TIMEOUT = 3
+ENDPOINT_PROBE_TIMEOUT = 3
+ENDPOINT_PROBE_INTERVAL = 60
 
 # API endpoints
 API_ENDPOINT = "/rpc"
@@ -26,6 +125,10 @@ SENSOR_SYSTEM_STATUS = "system_status"
 SENSOR_SYSTEM_INFO = "system_info"
 SENSOR_DISK_INFO = "disk_info"
 
+# Hardware capabilities detected from system status
+CAPABILITY_BATTERY = "battery"
+CAPABILITY_CPU_TEMPERATURE = "cpu_temperature"
+
 # Switch types
 SWITCH_VPN = "vpn"
 
@@ -1,15 +1,55 @@
 """Data update coordinator for GL.iNet integration."""
+import cProfile
 import logging
-from datetime import timedelta
-from typing import Any, Dict
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Set
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .api import GLiNetAPI
-from .const import CONF_HOST, DEFAULT_SCAN_INTERVAL, DOMAIN
+from .api import GLiNetAPI, parse_hosts
+from .const import (
+    CONF_ADDITIONAL_HOSTS,
+    CAPABILITY_BATTERY,
+    CAPABILITY_CPU_TEMPERATURE,
+    CONF_CERT_FINGERPRINT,
+    CONF_CRITICAL_BATTERY_THRESHOLD,
+    CONF_HOST,
+    CONF_LOW_BATTERY_THRESHOLD,
+    CONF_RATE_WINDOW,
+    CONF_USE_HTTPS,
+    DEFAULT_CRITICAL_BATTERY_THRESHOLD,
+    DEFAULT_LOW_BATTERY_THRESHOLD,
+    DEFAULT_RATE_WINDOW,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_TOP_TALKERS,
+    DOMAIN,
+    POWER_PROFILE_BATTERY,
+    POWER_PROFILE_CRITICAL_BATTERY,
+    POWER_PROFILE_INTERVAL_FACTORS,
+    POWER_PROFILE_LOW_BATTERY,
+    POWER_PROFILE_MAINS,
+    ROUTER_EXECUTOR_WORKERS,
+    TRAFFIC_WINDOWS,
+)
+from .executor import RouterExecutor
+from .profiling import RefreshTracer
+from .rates import RateEngine
+from .records import (
+    ClientRecord,
+    NetworkInterface,
+    VPNProfile,
+    WireGuardPeer,
+    client_key,
+    merge_records,
+    project,
+    vpn_profile_key,
+)
+from .traffic import ClientTrafficTracker
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,7 +62,10 @@ class GLiNetDataUpdateCoordinator(DataUpdateCoordinator):
         self.api = GLiNetAPI(
             entry.data[CONF_HOST],
             entry.data[CONF_USERNAME],
-            entry.data[CONF_PASSWORD]
+            entry.data[CONF_PASSWORD],
+            entry.data.get(CONF_USE_HTTPS, False),
+            entry.data.get(CONF_CERT_FINGERPRINT) or None,
+            parse_hosts(entry.options.get(CONF_ADDITIONAL_HOSTS, "")),
         )
         
         super().__init__(
@@ -32,63 +75,475 @@ class GLiNetDataUpdateCoordinator(DataUpdateCoordinator):
             update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
         )
 
+        # Blocking API calls run on a pool of their own, not on HA's shared executor
+        self.executor = RouterExecutor(f"{DOMAIN}_{entry.data[CONF_HOST]}", ROUTER_EXECUTOR_WORKERS)
+
+        # id -> rule indexes, rebuilt whenever the firewall lists are fetched
+        self.firewall_rule_index: Dict[str, Dict[str, Any]] = {}
+        self.port_forward_index: Dict[str, Dict[str, Any]] = {}
+
+        # WireGuard server peers by peer id, plus the ids changed by the last update
+        self.wg_peer_index: Dict[str, WireGuardPeer] = {}
+        self.wg_peer_changes: Set[str] = set()
+
+        # Smoothed byte/s rates for tunnels and peers, computed from their counters
+        self.rate_engine = RateEngine(entry.options.get(CONF_RATE_WINDOW, DEFAULT_RATE_WINDOW))
+        self.rates: Dict[str, Optional[tuple]] = {}
+
+        # Clients by upper-case MAC, and their traffic over sliding windows
+        self.client_index: Dict[str, ClientRecord] = {}
+        self.client_changes: Set[str] = set()
+        self.client_traffic = ClientTrafficTracker(TRAFFIC_WINDOWS)
+        self.top_talkers: List[Dict[str, Any]] = []
+
+        # Records reused between refreshes and updated in place
+        self.vpn_profile_index: Dict[str, VPNProfile] = {}
+        self.interface_index: Dict[str, NetworkInterface] = {}
+
+        # Battery routers poll less often while discharging
+        self.base_update_interval = self.update_interval
+        self.power_profile = POWER_PROFILE_MAINS
+        self.low_battery_threshold = entry.options.get(
+            CONF_LOW_BATTERY_THRESHOLD, DEFAULT_LOW_BATTERY_THRESHOLD
+        )
+        self.critical_battery_threshold = entry.options.get(
+            CONF_CRITICAL_BATTERY_THRESHOLD, DEFAULT_CRITICAL_BATTERY_THRESHOLD
+        )
+
+        # Used fraction of the router's httpd memory, which throttles the RPC budget
+        self.httpd_memory_usage: Optional[float] = None
+
+        # Set while a refresh trace is captured, see async_trace_refreshes
+        self.tracer: Optional[RefreshTracer] = None
+
     async def _async_update_data(self) -> Dict[str, Any]:
         """Fetch data from API endpoint."""
+        if self.tracer is not None:
+            self.tracer.start_cycle()
         try:
             # Run API calls in executor since they're blocking
-            vpn_status = await self.hass.async_add_executor_job(self.api.get_active_vpn)
-            system_status = await self.hass.async_add_executor_job(self.api.get_system_status)
-            system_info = await self.hass.async_add_executor_job(self.api.get_system_info)
-            disk_info = await self.hass.async_add_executor_job(self.api.get_disk_info)
-            vpn_configs = await self.hass.async_add_executor_job(self.api.get_all_vpn_configs)
+            vpn_status = await self.async_add_api_job(self.api.get_active_vpn)
+            system_status = await self.async_add_api_job(self.api.get_system_status)
+            system_info = await self.async_add_api_job(self.api.get_system_info)
+            disk_info = await self.async_add_api_job(self.api.get_disk_info)
+            vpn_configs = await self.async_add_api_job(self.api.get_all_vpn_configs)
             
             # Additional monitoring data
-            load_info = await self.hass.async_add_executor_job(self.api.get_load)
-            timezone_config = await self.hass.async_add_executor_job(self.api.get_timezone_config)
-            security_policy = await self.hass.async_add_executor_job(self.api.get_security_policy)
+            load_info = await self.async_add_api_job(self.api.get_load)
+            timezone_config = await self.async_add_api_job(self.api.get_timezone_config)
+            security_policy = await self.async_add_api_job(self.api.get_security_policy)
             
             # Firewall data
-            firewall_rules = await self.hass.async_add_executor_job(self.api.get_firewall_rules)
-            dmz_config = await self.hass.async_add_executor_job(self.api.get_dmz_config)
-            port_forwards = await self.hass.async_add_executor_job(self.api.get_port_forward_list)
-            wan_access = await self.hass.async_add_executor_job(self.api.get_wan_access)
-            zone_list = await self.hass.async_add_executor_job(self.api.get_zone_list)
+            firewall_rules = await self.async_add_api_job(self.api.get_firewall_rules)
+            dmz_config = await self.async_add_api_job(self.api.get_dmz_config)
+            port_forwards = await self.async_add_api_job(self.api.get_port_forward_list)
+            wan_access = await self.async_add_api_job(self.api.get_wan_access)
+            zone_list = await self.async_add_api_job(self.api.get_zone_list)
             
             # VPN Server data
-            wg_server_status = await self.hass.async_add_executor_job(self.api.get_wg_server_status)
-            wg_server_config = await self.hass.async_add_executor_job(self.api.get_wg_server_config)
-            ovpn_server_status = await self.hass.async_add_executor_job(self.api.get_ovpn_server_status)
+            wg_server_status = await self.async_add_api_job(self.api.get_wg_server_status)
+            wg_server_config = await self.async_add_api_job(self.api.get_wg_server_config)
+            ovpn_server_status = await self.async_add_api_job(self.api.get_ovpn_server_status)
             
             # WiFi data
-            wifi_config = await self.hass.async_add_executor_job(self.api.get_wifi_config)
-            wifi_status_detail = await self.hass.async_add_executor_job(self.api.get_wifi_status)
-            clients = await self.hass.async_add_executor_job(self.api.get_clients)
+            wifi_config = await self.async_add_api_job(self.api.get_wifi_config)
+            wifi_status_detail = await self.async_add_api_job(self.api.get_wifi_status)
+            clients = await self.async_add_api_job(self.api.get_clients)
+            
+            httpd_mem_status = await self.async_add_api_job(self.api.get_httpd_mem_status)
+            
+            if self.tracer is not None:
+                merge_started = time.perf_counter()
+            self._index_firewall(firewall_rules, port_forwards)
+            self._index_wg_peers(wg_server_status)
+            self._update_tunnel_rates(vpn_status, wg_server_status, ovpn_server_status)
+            clients = self._index_clients(clients)
+            vpn_configs = self._index_vpn_profiles(vpn_configs)
+            self._index_interfaces(system_status)
+            self._adapt_rate_limit(load_info, system_info, httpd_mem_status)
+            self._update_power_profile(system_status)
             
-            return {
+            data = {
                 "vpn_status": vpn_status,
                 "system_status": system_status,
-                "system_info": system_info,
-                "disk_info": disk_info,
+                "system_info": self._detail("system_info", system_info),
+                "disk_info": self._detail("disk_info", disk_info),
                 "vpn_configs": vpn_configs,
                 "load_info": load_info,
-                "timezone_config": timezone_config,
-                "security_policy": security_policy,
-                "firewall_rules": firewall_rules,
+                "timezone_config": self._detail("timezone_config", timezone_config),
+                "security_policy": self._detail("security_policy", security_policy),
+                "firewall_rules": self._detail("firewall_rules", firewall_rules),
                 "dmz": dmz_config,
-                "port_forwards": port_forwards,
+                "port_forwards": self._detail("port_forwards", port_forwards),
                 "wan_access": wan_access,
-                "zone_list": zone_list,
+                "zone_list": self._detail("zone_list", zone_list),
                 "wg_server_status": wg_server_status,
-                "wg_server_config": wg_server_config,
+                "wg_server_config": self._detail("wg_server_config", wg_server_config),
                 "ovpn_server_status": ovpn_server_status,
-                "wifi_config": wifi_config,
+                "wifi_config": self._detail("wifi_config", wifi_config),
                 "wifi_status_detail": wifi_status_detail,
                 "clients": clients,
+                "executor_stats": self.executor.take_stats(),
             }
+            if self.tracer is not None:
+                self.tracer.add_span("snapshot.merge", time.perf_counter() - merge_started)
+            return data
             
         except Exception as exc:
             raise UpdateFailed(f"Error communicating with API: {exc}") from exc
 
+    def _detail(self, key: str, response: Optional[Dict]) -> Any:
+        """Project a detail response, keeping the last one if the read was dropped or failed."""
+        if response is None and self.data and self.data.get(key) is not None:
+            return self.data[key]
+        return project(key, response)
+
+    def load_per_core(self, data: Optional[Dict[str, Any]] = None) -> Optional[float]:
+        """Return the 1 minute load average divided by the CPU count."""
+        data = data if data is not None else self.data
+        load_average = (data.get("load_info") or {}).get("load_average") or (
+            (data.get("system_status") or {}).get("system", {}).get("load_average")
+        )
+        if not load_average:
+            return None
+        cpu_num = (data.get("system_info") or {}).get("cpu_num") or 1
+        return load_average[0] / cpu_num
+
+    def _adapt_rate_limit(
+        self,
+        load_info: Optional[Dict],
+        system_info: Optional[Dict],
+        httpd_mem_status: Optional[Dict],
+    ) -> None:
+        """Scale the RPC budget to the load and httpd memory the router reports."""
+        if system_info is None and self.data:
+            system_info = self.data.get("system_info")
+        load = self.load_per_core({"load_info": load_info, "system_info": system_info})
+
+        memory_usage = self.httpd_memory_usage
+        status = httpd_mem_status or {}
+        total = status.get("total") or status.get("mem_total")
+        used = status.get("used", status.get("mem_used"))
+        free = status.get("free", status.get("mem_free"))
+        if total and used is not None:
+            memory_usage = used / total
+        elif total and free is not None:
+            memory_usage = (total - free) / total
+
+        self.httpd_memory_usage = memory_usage
+        rate = self.api.rate_limiter.adapt(load, memory_usage)
+        _LOGGER.debug("RPC budget %.2f calls/s (load %s per core, httpd memory %s)", rate, load, memory_usage)
+
+    @property
+    def power_interval_factor(self) -> int:
+        """Return how many times longer than normal the active power profile polls."""
+        return POWER_PROFILE_INTERVAL_FACTORS[self.power_profile]
+
+    def _update_power_profile(self, system_status: Optional[Dict]) -> None:
+        """Pick the power profile from the battery MCU and stretch the interval to match."""
+        if system_status is None:
+            return
+        mcu = system_status.get("system", {}).get("mcu") or {}
+        charge_percent = mcu.get("charge_percent")
+        if not mcu or mcu.get("charging_status") != 0 or charge_percent is None:
+            profile = POWER_PROFILE_MAINS
+        elif charge_percent <= self.critical_battery_threshold:
+            profile = POWER_PROFILE_CRITICAL_BATTERY
+        elif charge_percent <= self.low_battery_threshold:
+            profile = POWER_PROFILE_LOW_BATTERY
+        else:
+            profile = POWER_PROFILE_BATTERY
+
+        if profile != self.power_profile:
+            _LOGGER.info("Power profile changed from %s to %s", self.power_profile, profile)
+            self.power_profile = profile
+            # Takes effect when the next refresh is scheduled
+            self.update_interval = self.base_update_interval * self.power_interval_factor
+
+    async def async_check_power_source(self, _now: Optional[datetime] = None) -> None:
+        """Check the battery MCU between stretched refreshes, so mains power is noticed promptly."""
+        if self.power_profile == POWER_PROFILE_MAINS:
+            return
+        system_status = await self.async_add_api_job(self.api.get_system_status)
+        previous_interval = self.update_interval
+        self._update_power_profile(system_status)
+        if self.update_interval < previous_interval:
+            # Back on the charger: refresh now instead of at the stretched deadline
+            await self.async_request_refresh()
+
+    def detect_capabilities(self) -> Set[str]:
+        """Return the optional hardware features reported by the router."""
+        system = ((self.data or {}).get("system_status") or {}).get("system", {})
+        capabilities = set()
+        if system.get("mcu"):
+            capabilities.add(CAPABILITY_BATTERY)
+        if (system.get("cpu") or {}).get("temperature") is not None:
+            capabilities.add(CAPABILITY_CPU_TEMPERATURE)
+        return capabilities
+
+    def _index_firewall(self, firewall_rules: Optional[Dict], port_forwards: Optional[Dict]) -> None:
+        """Rebuild the id -> rule indexes for firewall rules and port forwards.
+
+        A list that failed to read or was dropped keeps its previous index, so
+        its rule switches are not taken for deleted rules.
+        """
+        if firewall_rules is not None:
+            self.firewall_rule_index = {
+                rule["id"]: rule for rule in firewall_rules.get("res", []) if rule.get("id")
+            }
+        if port_forwards is not None:
+            self.port_forward_index = {
+                rule["id"]: rule for rule in port_forwards.get("res", []) if rule.get("id")
+            }
+
+    async def async_refresh_firewall(self) -> None:
+        """Refresh only the firewall rule and port forward lists."""
+        firewall_rules = await self.async_add_api_job(self.api.get_firewall_rules)
+        port_forwards = await self.async_add_api_job(self.api.get_port_forward_list)
+        if firewall_rules is None or port_forwards is None:
+            await self.async_request_refresh()
+            return
+
+        self._index_firewall(firewall_rules, port_forwards)
+        self.wg_peer_changes = set()
+        self.async_set_updated_data(
+            {**self.data, "firewall_rules": firewall_rules, "port_forwards": port_forwards}
+        )
+
+    def _index_wg_peers(self, wg_server_status: Optional[Dict]) -> None:
+        """Rebuild the WireGuard peer table and record which peers changed."""
+        if wg_server_status is None:
+            # Failed or dropped read: keep the last table rather than drop every peer
+            self.wg_peer_changes = set()
+            return
+        now = time.monotonic()
+        rows = []
+
+        for peer in wg_server_status.get("peers", []):
+            peer_id = str(peer.get("peer_id") or peer.get("id") or peer.get("name") or "")
+            if not peer_id:
+                continue
+
+            rx_bytes = peer.get("rx_bytes") or 0
+            tx_bytes = peer.get("tx_bytes") or 0
+            rates = self.rate_engine.sample(f"wg_peer:{peer_id}", rx_bytes, tx_bytes, now)
+            rx_rate, tx_rate = rates or (None, None)
+
+            rows.append({
+                "peer_id": peer_id,
+                "name": peer.get("name") or peer_id,
+                "connected": peer.get("status") == 1,
+                "enabled": peer.get("enabled", True),
+                "private_ip": peer.get("private_ip"),
+                "public_ip": peer.get("public_ip"),
+                "latest_handshake": peer.get("latest_handshake") or None,
+                "rx_bytes": rx_bytes,
+                "tx_bytes": tx_bytes,
+                "rx_rate": rx_rate,
+                "tx_rate": tx_rate,
+            })
+
+        self.wg_peer_index, self.wg_peer_changes = merge_records(
+            self.wg_peer_index, rows, WireGuardPeer, lambda row: row["peer_id"]
+        )
+        self.rate_engine.retain((f"wg_peer:{peer_id}" for peer_id in self.wg_peer_index), "wg_peer:")
+
+    def _update_tunnel_rates(
+        self,
+        vpn_status: Optional[Dict],
+        wg_server_status: Optional[Dict],
+        ovpn_server_status: Optional[Dict],
+    ) -> None:
+        """Update smoothed rates for the VPN client and the VPN servers."""
+        now = time.monotonic()
+        self._update_vpn_client_rate(vpn_status, now)
+        self._update_tunnel_rate("wg_server", (wg_server_status or {}).get("server"), now)
+        self._update_tunnel_rate("ovpn_server", ovpn_server_status, now)
+
+    def _update_vpn_client_rate(self, vpn_status: Optional[Dict], now: float) -> None:
+        """Update the smoothed rate of the active VPN client tunnel."""
+        vpn_status = vpn_status or {}
+        # The active client tunnel can change between refreshes; its counters
+        # then belong to a different connection, so the source starts over.
+        vpn_epoch = (vpn_status.get("group_id"), vpn_status.get("client_id"), vpn_status.get("peer_id"))
+        self._update_tunnel_rate("vpn_client", vpn_status, now, vpn_epoch)
+
+    def _update_tunnel_rate(
+        self, source: str, status: Optional[Dict], now: float, epoch: Any = None
+    ) -> None:
+        """Sample one tunnel's counters, which must be freshly read, into its rate."""
+        status = status or {}
+        if status.get("status") == 1:
+            self.rates[source] = self.rate_engine.sample(
+                source, status.get("rx_bytes"), status.get("tx_bytes"), now, epoch
+            )
+        else:
+            self.rate_engine.discard(source)
+            self.rates[source] = None
+
+    def _index_clients(self, clients: List[Dict]) -> List[ClientRecord]:
+        """Update the client records in place and account client traffic."""
+        self.client_index, self.client_changes = merge_records(
+            self.client_index, clients, ClientRecord, client_key
+        )
+        records = list(self.client_index.values())
+        self.client_traffic.update(records, time.monotonic())
+        self.top_talkers = self.client_traffic.top(next(iter(TRAFFIC_WINDOWS)), DEFAULT_TOP_TALKERS)
+        return records
+
+    def _index_vpn_profiles(self, vpn_configs: List[VPNProfile]) -> List[VPNProfile]:
+        """Keep one VPN profile record per profile across refreshes."""
+        self.vpn_profile_index, _ = merge_records(
+            self.vpn_profile_index, vpn_configs, VPNProfile, vpn_profile_key
+        )
+        return list(self.vpn_profile_index.values())
+
+    def _index_interfaces(self, system_status: Optional[Dict]) -> None:
+        """Replace the status network list with interface records updated in place."""
+        if not system_status or "network" not in system_status:
+            return
+        self.interface_index, _ = merge_records(
+            self.interface_index,
+            system_status["network"],
+            NetworkInterface,
+            lambda iface: iface.get("interface"),
+        )
+        system_status["network"] = list(self.interface_index.values())
+
+    async def async_refresh_wg_server(self) -> None:
+        """Refresh only the WireGuard server status."""
+        wg_server_status = await self.async_add_api_job(self.api.get_wg_server_status)
+        if wg_server_status is None:
+            await self.async_request_refresh()
+            return
+
+        self._index_wg_peers(wg_server_status)
+        # Only the server counters are fresh; the other tunnels keep their rates
+        self._update_tunnel_rate("wg_server", (wg_server_status or {}).get("server"), time.monotonic())
+        self.async_set_updated_data({**self.data, "wg_server_status": wg_server_status})
+
+    async def async_probe_endpoints(self, _now: Optional[datetime] = None) -> None:
+        """Measure the RTT of every router address and move to the fastest healthy one."""
+        await self.async_add_api_job(self.api.probe_endpoints)
+
+    async def async_add_api_job(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking API call on the router's own thread pool."""
+        return await self.executor.async_run(func, *args)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all listeners, timing state writes per platform while tracing."""
+        tracer = self.tracer
+        if tracer is None:
+            super().async_update_listeners()
+            return
+
+        for update_callback, _ in list(self._listeners.values()):
+            # Entity listeners are bound methods of the entity
+            platform = getattr(getattr(update_callback, "__self__", None), "platform", None)
+            started = time.perf_counter()
+            update_callback()
+            tracer.add_span(
+                "state_write", time.perf_counter() - started, platform.domain if platform else "other"
+            )
+        tracer.end_cycle(None if self.last_update_success else str(self.last_exception))
+
+    async def async_trace_refreshes(self, cycles: int, write_profile: bool = False) -> Dict[str, Any]:
+        """Run refresh cycles back to back and return their span timings.
+
+        With ``write_profile``, the event loop is also profiled with cProfile
+        over the whole capture and the stats are written to the config dir.
+        """
+        if self.tracer is not None:
+            raise HomeAssistantError("A refresh trace is already running")
+
+        tracer = RefreshTracer()
+        profiler = cProfile.Profile() if write_profile else None
+        self.tracer = self.api.tracer = self.executor.tracer = tracer
+        try:
+            if profiler is not None:
+                try:
+                    profiler.enable()
+                except ValueError as exc:
+                    # Only one profiler can run at a time, e.g. not alongside HA's profiler
+                    raise HomeAssistantError(f"Cannot start cProfile: {exc}") from exc
+            for _ in range(cycles):
+                await self.async_refresh()
+                # Closes cycles whose failure did not reach the listeners
+                tracer.end_cycle(None if self.last_update_success else str(self.last_exception))
+        finally:
+            if profiler is not None:
+                profiler.disable()
+            self.tracer = self.api.tracer = self.executor.tracer = None
+
+        report = tracer.report()
+        if profiler is not None:
+            path = self.hass.config.path(
+                f"{DOMAIN}_profile_{self.config_entry.entry_id}_{int(time.time())}.prof"
+            )
+            await self.hass.async_add_executor_job(profiler.dump_stats, path)
+            report["profile"] = path
+            _LOGGER.info("Wrote refresh profile to %s", path)
+        return report
+
+    @callback
+    def merge_partial_data(self, partial: Dict[str, Any]) -> None:
+        """Merge a partial snapshot and notify entities without rescheduling the refresh."""
+        if "system_status" in partial:
+            self._index_interfaces(partial["system_status"])
+        if "vpn_status" in partial:
+            # The server counters in the snapshot are stale; only the client is fresh
+            self._update_vpn_client_rate(partial["vpn_status"], time.monotonic())
+        if "system_status" in partial:
+            self._update_power_profile(partial["system_status"])
+        if "load_info" in partial:
+            self._adapt_rate_limit(partial["load_info"], self.data.get("system_info"), None)
+        self.wg_peer_changes = set()
+        self.client_changes = set()
+        self.data = {**self.data, **partial}
+        self.async_update_listeners()
+
+    async def async_set_wg_peer_enabled(self, peer_id: str, enabled: bool) -> bool:
+        """Enable or disable a WireGuard server peer."""
+        if peer_id not in self.wg_peer_index:
+            _LOGGER.error("WireGuard peer not found: %s", peer_id)
+            return False
+
+        result = await self.async_add_api_job(
+            self.api.set_wg_server_peer, {"peer_id": peer_id, "enabled": enabled}
+        )
+        if result is not None and not result.get("err_code"):
+            await self.async_refresh_wg_server()
+            return True
+        return False
+
+    async def async_set_firewall_rule_enabled(self, rule_id: str, enabled: bool) -> bool:
+        """Enable or disable a firewall rule."""
+        return await self._async_set_rule_enabled(
+            self.firewall_rule_index, self.api.set_firewall_rule, rule_id, enabled
+        )
+
+    async def async_set_port_forward_enabled(self, rule_id: str, enabled: bool) -> bool:
+        """Enable or disable a port forward."""
+        return await self._async_set_rule_enabled(
+            self.port_forward_index, self.api.set_port_forward, rule_id, enabled
+        )
+
+    async def _async_set_rule_enabled(self, index, setter, rule_id: str, enabled: bool) -> bool:
+        """Toggle a rule, resending its other fields unchanged."""
+        rule = index.get(rule_id)
+        if rule is None:
+            _LOGGER.error("Firewall rule not found: %s", rule_id)
+            return False
+
+        params = {key: value for key, value in rule.items() if key != "id"}
+        params["enabled"] = enabled
+        result = await self.async_add_api_job(setter, rule_id, params)
+        if result is not None and not result.get("err_code"):
+            await self.async_refresh_firewall()
+            return True
+        return False
+
     async def async_start_vpn(self, vpn_name: str) -> bool:
         """Start a VPN connection."""
         vpn_configs = self.data.get("vpn_configs", [])
@@ -96,9 +551,9 @@ class GLiNetDataUpdateCoordinator(DataUpdateCoordinator):
         for config in vpn_configs:
             if config.get("name") == vpn_name:
                 # Stop all VPNs first
-                await self.hass.async_add_executor_job(self.api.stop_all_vpns)
+                await self.async_add_api_job(self.api.stop_all_vpns)
                 # Start the requested VPN
-                result = await self.hass.async_add_executor_job(self.api.start_vpn, config)
+                result = await self.async_add_api_job(self.api.start_vpn, config)
                 if result:
                     await self.async_request_refresh()
                 return result
@@ -112,7 +567,7 @@ class GLiNetDataUpdateCoordinator(DataUpdateCoordinator):
         
         for config in vpn_configs:
             if config.get("name") == vpn_name:
-                result = await self.hass.async_add_executor_job(self.api.stop_vpn, config)
+                result = await self.async_add_api_job(self.api.stop_vpn, config)
                 if result:
                     await self.async_request_refresh()
                 return result
@@ -122,23 +577,23 @@ class GLiNetDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def async_stop_all_vpns(self) -> bool:
         """Stop all VPN connections."""
-        result = await self.hass.async_add_executor_job(self.api.stop_all_vpns)
+        result = await self.async_add_api_job(self.api.stop_all_vpns)
         if result:
             await self.async_request_refresh()
         return result
 
     async def async_reboot_system(self) -> bool:
         """Reboot the router."""
-        return await self.hass.async_add_executor_job(self.api.reboot_system)
+        return await self.async_add_api_job(self.api.reboot_system)
 
     async def async_check_firmware(self) -> Dict[str, Any]:
         """Check for firmware updates."""
-        return await self.hass.async_add_executor_job(self.api.check_firmware_online)
+        return await self.async_add_api_job(self.api.check_firmware_online)
 
     # VPN Server methods
     async def async_start_wg_server(self) -> bool:
         """Start WireGuard server."""
-        result = await self.hass.async_add_executor_job(self.api.start_wg_server)
+        result = await self.async_add_api_job(self.api.start_wg_server)
         if result and not result.get("err_code"):
             await self.async_request_refresh()
             return True
@@ -146,7 +601,7 @@ class GLiNetDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def async_stop_wg_server(self) -> bool:
         """Stop WireGuard server."""
-        result = await self.hass.async_add_executor_job(self.api.stop_wg_server)
+        result = await self.async_add_api_job(self.api.stop_wg_server)
         if result and not result.get("err_code"):
             await self.async_request_refresh()
             return True
@@ -154,7 +609,7 @@ class GLiNetDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def async_start_ovpn_server(self) -> bool:
         """Start OpenVPN server."""
-        result = await self.hass.async_add_executor_job(self.api.start_ovpn_server)
+        result = await self.async_add_api_job(self.api.start_ovpn_server)
         if result and not result.get("err_code"):
             await self.async_request_refresh()
             return True
@@ -162,7 +617,7 @@ class GLiNetDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def async_stop_ovpn_server(self) -> bool:
         """Stop OpenVPN server."""
-        result = await self.hass.async_add_executor_job(self.api.stop_ovpn_server)
+        result = await self.async_add_api_job(self.api.stop_ovpn_server)
         if result and not result.get("err_code"):
             await self.async_request_refresh()
             return True
@@ -171,7 +626,7 @@ class GLiNetDataUpdateCoordinator(DataUpdateCoordinator):
     # WiFi methods
     async def async_set_wifi_enabled(self, iface_name: str, enabled: bool) -> bool:
         """Enable or disable a WiFi interface."""
-        result = await self.hass.async_add_executor_job(
+        result = await self.async_add_api_job(
             self.api.set_wifi_config,
             {"iface_name": iface_name, "enabled": enabled}
         )
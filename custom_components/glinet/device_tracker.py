@@ -14,6 +14,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import GLiNetDataUpdateCoordinator
+from .records import ClientRecord
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -44,8 +45,9 @@ async def async_setup_entry(
 
             mac_address = client_data["mac"].upper()
             if mac_address in tracked_devices:
+                # Client records are updated in place; the entity writes its
+                # own state on coordinator updates.
                 tracked_devices[mac_address].client_data = client_data
-                tracked_devices[mac_address].async_write_ha_state()
             else:
                 new_device = GlinetScannerEntity(coordinator, client_data)
                 tracked_devices[mac_address] = new_device
@@ -64,7 +66,7 @@ class GlinetScannerEntity(CoordinatorEntity[GLiNetDataUpdateCoordinator], Scanne
     def __init__(
         self,
         coordinator: GLiNetDataUpdateCoordinator,
-        client_data: dict[str, Any],
+        client_data: ClientRecord,
     ) -> None:
         """Initialize a GL.iNet tracker entity."""
         super().__init__(coordinator)
@@ -83,11 +85,10 @@ class GlinetScannerEntity(CoordinatorEntity[GLiNetDataUpdateCoordinator], Scanne
     @property
     def is_connected(self) -> bool:
         """Return true if the device is connected to the network."""
-        mac = self.unique_id
-        for client in self.coordinator.data.get("clients", []):
-            if client.get("mac", "").upper() == mac:
-                return client.get("online", False)
-        return False
+        client = self.coordinator.client_index.get(self.unique_id)
+        if client is None:
+            return False
+        return client.get("online", False)
 
     @property
     def source_type(self) -> str:
@@ -0,0 +1,42 @@
+"""Diagnostics support for GL.iNet integration."""
+from typing import Any, Dict
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_PASSWORD, CONF_USERNAME, DOMAIN
+from .coordinator import GLiNetDataUpdateCoordinator
+
+TO_REDACT = {CONF_PASSWORD, CONF_USERNAME}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> Dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: GLiNetDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    api = coordinator.api
+
+    return {
+        "entry": {
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "endpoints": {
+            "active": api.active_endpoint,
+            "rtt_ms": dict(api.endpoint_rtt),
+        },
+        "power_profile": coordinator.power_profile,
+        "update_interval": coordinator.update_interval.total_seconds(),
+        "executor": coordinator.data.get("executor_stats"),
+        "rate_limiter": {
+            "rate": api.rate_limiter.rate,
+            "base_rate": api.rate_limiter.base_rate,
+            "delayed": api.rate_limiter.delayed,
+            "dropped": api.rate_limiter.dropped,
+            "httpd_memory_usage": coordinator.httpd_memory_usage,
+        },
+        "response_cache": api.cache.stats(),
+        "single_flight": api.single_flight.stats(),
+    }
@@ -0,0 +1,82 @@
+"""Network scan for GL.iNet routers used by the config flow."""
+import asyncio
+import ipaddress
+import logging
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+
+from .api import url_host
+
+_LOGGER = logging.getLogger(__name__)
+
+# Unauthenticated first half of the GL.iNet login handshake
+CHALLENGE_REQUEST = {
+    "jsonrpc": "2.0",
+    "method": "challenge",
+    "params": {"username": "root"},
+    "id": 0,
+}
+
+
+def network_hosts(network: str, max_hosts: int) -> List[str]:
+    """Return the host addresses of a CIDR network.
+
+    Raises ValueError for a malformed network or one with more than
+    ``max_hosts`` addresses.
+    """
+    parsed = ipaddress.ip_network(network.strip(), strict=False)
+    if parsed.num_addresses > max_hosts + 2:
+        raise ValueError(f"Network {parsed} has more than {max_hosts} hosts")
+    hosts = list(parsed.hosts())
+    return [str(host) for host in hosts or [parsed.network_address]]
+
+
+async def async_probe_host(
+    session: aiohttp.ClientSession, url: str, timeout: float
+) -> bool:
+    """Return true if a URL answers the GL.iNet challenge RPC."""
+    try:
+        async with session.post(
+            url,
+            json=CHALLENGE_REQUEST,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+            # Routers ship self-signed certificates; the entry pins one later
+            ssl=False,
+        ) as response:
+            if response.status != 200:
+                return False
+            data: Dict[str, Any] = await response.json(content_type=None)
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+        return False
+    result = data.get("result") if isinstance(data, dict) else None
+    return isinstance(result, dict) and all(result.get(key) for key in ("alg", "salt", "nonce"))
+
+
+async def async_discover_routers(
+    session: aiohttp.ClientSession,
+    hosts: List[str],
+    concurrency: int,
+    timeout: float,
+) -> Dict[str, bool]:
+    """Probe hosts concurrently and return the GL.iNet routers found.
+
+    Each host is probed over HTTP and HTTPS at once. The result maps every
+    router to whether it is only reachable over HTTPS.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def probe(host: str) -> Optional[bool]:
+        async with semaphore:
+            http, https = await asyncio.gather(
+                async_probe_host(session, f"http://{url_host(host)}/rpc", timeout),
+                async_probe_host(session, f"https://{url_host(host)}/rpc", timeout),
+            )
+        if http:
+            return False
+        return True if https else None
+
+    results = await asyncio.gather(*(probe(host) for host in hosts))
+    found = {host: https for host, https in zip(hosts, results) if https is not None}
+    _LOGGER.debug("Found %s GL.iNet routers among %s hosts", len(found), len(hosts))
+    return found
@@ -0,0 +1,100 @@
+"""Bounded thread pool that isolates the blocking I/O of one GL.iNet router."""
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from .profiling import RefreshTracer
+
+
+class RouterExecutor:
+    """Small thread pool for one router's blocking RPC calls.
+
+    A wedged router can only tie up these few threads, never Home Assistant's
+    shared executor. The pool also keeps queue depth and saturation figures,
+    where saturation is the share of time every worker was busy.
+    """
+
+    def __init__(self, name: str, max_workers: int) -> None:
+        """Initialize the pool."""
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix=name)
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._peak_queued = 0
+        self._calls = 0
+        self._queued_calls = 0
+        self._saturated_since: Optional[float] = None
+        self._saturated_time = 0.0
+        self._window_start = time.monotonic()
+        # Set while a refresh trace is captured
+        self.tracer: Optional[RefreshTracer] = None
+
+    async def async_run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking call in the pool and return its result."""
+        with self._lock:
+            self._calls += 1
+            if self._running + self._queued >= self.max_workers:
+                self._queued_calls += 1
+            self._queued += 1
+            self._peak_queued = max(self._peak_queued, self._queued)
+        loop = asyncio.get_running_loop()
+        if self.tracer is not None:
+            return await loop.run_in_executor(
+                self._executor, self._run_traced, self.tracer, time.perf_counter(), func, args
+            )
+        return await loop.run_in_executor(self._executor, self._run, func, args)
+
+    def _run_traced(
+        self, tracer: RefreshTracer, submitted: float, func: Callable[..., Any], args: tuple
+    ) -> Any:
+        """Run a call on a worker thread, recording how long it was queued."""
+        tracer.add_span("executor.queue_wait", time.perf_counter() - submitted)
+        return self._run(func, args)
+
+    def _run(self, func: Callable[..., Any], args: tuple) -> Any:
+        """Run a call on a worker thread, tracking busy workers."""
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+            if self._running == self.max_workers:
+                self._saturated_since = time.monotonic()
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                if self._saturated_since is not None:
+                    self._saturated_time += time.monotonic() - self._saturated_since
+                    self._saturated_since = None
+                self._running -= 1
+
+    def take_stats(self) -> Dict[str, Any]:
+        """Return the pool figures since the previous call and start a new window."""
+        with self._lock:
+            now = time.monotonic()
+            saturated = self._saturated_time
+            if self._saturated_since is not None:
+                saturated += now - self._saturated_since
+                self._saturated_since = now
+            window = now - self._window_start
+            stats = {
+                "queue_depth": self._queued,
+                "peak_queue_depth": self._peak_queued,
+                "busy_workers": self._running,
+                "max_workers": self.max_workers,
+                "calls": self._calls,
+                "queued_calls": self._queued_calls,
+                "saturation": round(saturated / window * 100, 1) if window > 0 else 0.0,
+            }
+            self._peak_queued = self._queued
+            self._calls = 0
+            self._queued_calls = 0
+            self._saturated_time = 0.0
+            self._window_start = now
+        return stats
+
+    def shutdown(self) -> None:
+        """Stop accepting calls and drop queued ones without blocking."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
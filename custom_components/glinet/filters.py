@@ -0,0 +1,104 @@
+"""Publish filters that hold back insignificant changes of noisy sensors."""
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from .const import (
+    CONF_DEADBANDS,
+    CONF_HEARTBEAT_INTERVAL,
+    CONF_MIN_PUBLISH_INTERVAL,
+    DEFAULT_DEADBANDS,
+    DEFAULT_HEARTBEAT_INTERVAL,
+    DEFAULT_MIN_PUBLISH_INTERVAL,
+)
+
+
+class PublishFilter:
+    """Decide whether a new sensor value is worth a state write.
+
+    A value is published when it moved by more than the deadband (absolute,
+    or a percentage of the last published value) and at least
+    ``min_interval`` seconds have passed since the last write. Whatever the
+    value, a write is forced every ``heartbeat`` seconds so the history
+    never goes stale.
+    """
+
+    __slots__ = ("deadband", "percent", "min_interval", "heartbeat", "last_value", "last_published")
+
+    def __init__(self, deadband: float, percent: bool, min_interval: float, heartbeat: float) -> None:
+        """Initialize the filter."""
+        self.deadband = deadband
+        self.percent = percent
+        self.min_interval = min_interval
+        self.heartbeat = heartbeat
+        self.last_value: Any = None
+        self.last_published: Optional[float] = None
+
+    def should_publish(self, value: Any, now: float) -> bool:
+        """Return true if ``value`` should be written now."""
+        if self.last_published is None:
+            return True
+
+        elapsed = now - self.last_published
+        if elapsed >= self.heartbeat:
+            return True
+        if value == self.last_value:
+            return False
+        if not _is_number(value) or not _is_number(self.last_value):
+            return True
+        if elapsed < self.min_interval:
+            return False
+
+        threshold = self.deadband
+        if self.percent:
+            threshold = abs(self.last_value) * self.deadband / 100
+        return abs(value - self.last_value) > threshold
+
+    def published(self, value: Any, now: float) -> None:
+        """Record that ``value`` was written."""
+        self.last_value = value
+        self.last_published = now
+
+
+def _is_number(value: Any) -> bool:
+    """Return true for int and float values, but not bool."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def parse_deadbands(text: str) -> Dict[str, Tuple[float, bool]]:
+    """Parse ``key=value`` pairs such as ``cpu_load_1min=0.2, memory_free=5%``.
+
+    Raises ValueError on malformed input.
+    """
+    deadbands = {}
+    for item in text.replace("\n", ",").split(","):
+        item = item.strip()
+        if not item:
+            continue
+        key, _, value = item.partition("=")
+        key, value = key.strip(), value.strip()
+        if not key or not value:
+            raise ValueError(f"Invalid deadband: {item}")
+        percent = value.endswith("%")
+        deadband = float(value.rstrip("%"))
+        if deadband < 0:
+            raise ValueError(f"Negative deadband: {item}")
+        deadbands[key] = (deadband, percent)
+    return deadbands
+
+
+def build_publish_filter(key: str, options: Mapping[str, Any]) -> Optional[PublishFilter]:
+    """Return the publish filter for a sensor key, or None if it is unfiltered."""
+    deadbands = dict(DEFAULT_DEADBANDS)
+    try:
+        deadbands.update(parse_deadbands(options.get(CONF_DEADBANDS, "")))
+    except ValueError:
+        pass
+    if key not in deadbands:
+        return None
+
+    deadband, percent = deadbands[key]
+    return PublishFilter(
+        deadband,
+        percent,
+        options.get(CONF_MIN_PUBLISH_INTERVAL, DEFAULT_MIN_PUBLISH_INTERVAL),
+        options.get(CONF_HEARTBEAT_INTERVAL, DEFAULT_HEARTBEAT_INTERVAL) * 60,
+    )
@@ -1,14 +1,16 @@
 """Firewall management for GL.iNet routers."""
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MANUFACTURER
+from .const import DOMAIN, FIREWALL_SYNC_CONCURRENCY, MANUFACTURER
 from .coordinator import GLiNetDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -52,7 +54,7 @@ class GLiNetDMZSwitch(CoordinatorEntity, SwitchEntity):
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off DMZ."""
-        await self.hass.async_add_executor_job(
+        await self.coordinator.async_add_api_job(
             self.coordinator.api.set_dmz_config, False
         )
         await self.coordinator.async_request_refresh()
@@ -103,7 +105,7 @@ class GLiNetWANAccessSwitch(CoordinatorEntity, SwitchEntity):
         }
         config[f"enable_{self.access_type}"] = True
         
-        await self.hass.async_add_executor_job(
+        await self.coordinator.async_add_api_job(
             self.coordinator.api.set_wan_access, config
         )
         await self.coordinator.async_request_refresh()
@@ -120,12 +122,256 @@ class GLiNetWANAccessSwitch(CoordinatorEntity, SwitchEntity):
         }
         config[f"enable_{self.access_type}"] = False
         
-        await self.hass.async_add_executor_job(
+        await self.coordinator.async_add_api_job(
             self.coordinator.api.set_wan_access, config
         )
         await self.coordinator.async_request_refresh()
 
 
+class GLiNetFirewallRuleSwitch(CoordinatorEntity, SwitchEntity):
+    """Switch for a single firewall rule or port forward, keyed by router rule id."""
+
+    def __init__(self, coordinator: GLiNetDataUpdateCoordinator, rule_id: str, kind: str) -> None:
+        """Initialize the rule switch."""
+        super().__init__(coordinator)
+        self.rule_id = rule_id
+        self.kind = kind
+        rule = self._rule or {}
+        label = "Port Forward" if kind == "port_forward" else "Firewall Rule"
+        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{kind}_{rule_id}"
+        self._attr_name = f"{coordinator.config_entry.title} {label} {rule.get('name') or rule_id}"
+        self._attr_icon = "mdi:lan-connect" if kind == "port_forward" else "mdi:shield-check"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, coordinator.config_entry.entry_id)},
+            "name": coordinator.config_entry.title,
+            "manufacturer": MANUFACTURER,
+            "model": coordinator.data.get("system_info", {}).get("model", "Unknown"),
+            "sw_version": coordinator.data.get("system_info", {}).get("firmware_version", "Unknown"),
+        }
+
+    @property
+    def _rule(self) -> Optional[Dict[str, Any]]:
+        """Return the current rule from the coordinator index."""
+        if self.kind == "port_forward":
+            return self.coordinator.port_forward_index.get(self.rule_id)
+        return self.coordinator.firewall_rule_index.get(self.rule_id)
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return self.coordinator.last_update_success and self._rule is not None
+
+    @property
+    def is_on(self) -> bool:
+        """Return true if the rule is enabled."""
+        rule = self._rule or {}
+        return _normalize_value(rule.get("enabled", False)) == "1"
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        """Return extra state attributes."""
+        rule = self._rule or {}
+        attrs = {"rule_id": self.rule_id}
+        attrs.update({key: value for key, value in rule.items() if key not in ("id", "enabled")})
+        return attrs
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        """Enable the rule."""
+        await self._async_set_enabled(True)
+
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        """Disable the rule."""
+        await self._async_set_enabled(False)
+
+    async def _async_set_enabled(self, enabled: bool) -> None:
+        """Enable or disable the rule on the router."""
+        if self.kind == "port_forward":
+            success = await self.coordinator.async_set_port_forward_enabled(self.rule_id, enabled)
+        else:
+            success = await self.coordinator.async_set_firewall_rule_enabled(self.rule_id, enabled)
+        if not success:
+            _LOGGER.error("Failed to update %s %s", self.kind, self.rule_id)
+
+
+@callback
+def async_setup_firewall_rule_switches(
+    hass: HomeAssistant,
+    coordinator: GLiNetDataUpdateCoordinator,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Add and remove per-rule switches as the router's rule lists change."""
+    tracked: Dict[Tuple[str, str], GLiNetFirewallRuleSwitch] = {}
+
+    @callback
+    def update_rules() -> None:
+        """Sync tracked rule switches with the coordinator indexes."""
+        current = {("rule", rule_id) for rule_id in coordinator.firewall_rule_index}
+        current.update(("port_forward", rule_id) for rule_id in coordinator.port_forward_index)
+
+        new_entities = []
+        for kind, rule_id in current - tracked.keys():
+            entity = GLiNetFirewallRuleSwitch(coordinator, rule_id, kind)
+            tracked[(kind, rule_id)] = entity
+            new_entities.append(entity)
+
+        registry = er.async_get(hass)
+        for key in tracked.keys() - current:
+            entity = tracked.pop(key)
+            if entity.entity_id and registry.async_get(entity.entity_id):
+                registry.async_remove(entity.entity_id)
+            elif entity.hass:
+                hass.async_create_task(entity.async_remove())
+
+        if new_entities:
+            async_add_entities(new_entities)
+
+    entry.async_on_unload(coordinator.async_add_listener(update_rules))
+    update_rules()
+
+
+def _normalize_value(value: Any) -> str:
+    """Normalize a rule field so router and user values compare equal."""
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    value = str(value).strip().lower()
+    if value == "true":
+        return "1"
+    if value == "false":
+        return "0"
+    return value
+
+
+def diff_rule_sets(
+    current: List[Dict[str, Any]],
+    desired: List[Dict[str, Any]],
+    prune: bool = True,
+) -> Dict[str, List]:
+    """Diff desired rules against the router's rules, keyed by rule name.
+
+    Only the fields given in a desired rule are compared, so defaults the
+    router fills in on its own never cause a spurious update.
+    """
+    current_by_name = {rule["name"]: rule for rule in current if rule.get("name")}
+    desired_names = set()
+    plan: Dict[str, List] = {"add": [], "set": [], "remove": [], "unchanged": []}
+
+    for rule in desired:
+        name = rule["name"]
+        desired_names.add(name)
+        existing = current_by_name.get(name)
+        if existing is None:
+            plan["add"].append(rule)
+        elif any(
+            _normalize_value(existing.get(field)) != _normalize_value(value)
+            for field, value in rule.items()
+        ):
+            plan["set"].append((existing["id"], rule))
+        else:
+            plan["unchanged"].append(name)
+
+    if prune:
+        for name, rule in current_by_name.items():
+            if name not in desired_names:
+                plan["remove"].append((rule["id"], name))
+
+    return plan
+
+
+def firewall_sync_succeeded(report: Optional[Dict[str, Any]]) -> bool:
+    """Return true if a sync report has no failed changes and no unreadable lists."""
+    if report is None:
+        return False
+    return all(
+        "error" not in section and not section.get("failed")
+        for section in report.values()
+        if isinstance(section, dict)
+    )
+
+
+async def async_sync_firewall(
+    hass: HomeAssistant,
+    coordinator: GLiNetDataUpdateCoordinator,
+    rules: Optional[List[Dict[str, Any]]] = None,
+    port_forwards: Optional[List[Dict[str, Any]]] = None,
+    prune: bool = True,
+    dry_run: bool = False,
+) -> Dict[str, Any]:
+    """Reconcile firewall rules and port forwards with a desired set.
+
+    A list left as None is not touched. Changes are applied concurrently,
+    bounded by FIREWALL_SYNC_CONCURRENCY, with a single refresh at the end.
+    """
+    api = coordinator.api
+    semaphore = asyncio.Semaphore(FIREWALL_SYNC_CONCURRENCY)
+    report: Dict[str, Any] = {}
+
+    async def apply(func, *args) -> bool:
+        async with semaphore:
+            result = await coordinator.async_add_api_job(func, *args)
+        return result is not None and not (isinstance(result, dict) and result.get("err_code"))
+
+    async def sync(section: str, desired, get_list, add, set_, remove) -> None:
+        if desired is None:
+            return
+        unnamed = [rule for rule in desired if not rule.get("name")]
+        if unnamed:
+            _LOGGER.error("Skipping %s %s without a name", len(unnamed), section)
+        desired = [rule for rule in desired if rule.get("name")]
+
+        current = await coordinator.async_add_api_job(get_list)
+        if current is None:
+            report[section] = {"error": "Failed to read current list"}
+            return
+
+        plan = diff_rule_sets(current.get("res", []), desired, prune)
+        section_report = {
+            "added": [rule["name"] for rule in plan["add"]],
+            "updated": [rule["name"] for _, rule in plan["set"]],
+            "removed": [name for _, name in plan["remove"]],
+            "unchanged": len(plan["unchanged"]),
+            "skipped_unnamed": len(unnamed),
+            "failed": [],
+        }
+        report[section] = section_report
+        if dry_run:
+            return
+
+        names = []
+        tasks = []
+        for rule in plan["add"]:
+            names.append(rule["name"])
+            tasks.append(apply(add, rule))
+        for rule_id, rule in plan["set"]:
+            names.append(rule["name"])
+            tasks.append(apply(set_, rule_id, rule))
+        for rule_id, name in plan["remove"]:
+            names.append(name)
+            tasks.append(apply(remove, rule_id))
+
+        results = await asyncio.gather(*tasks)
+        section_report["failed"] = [name for name, ok in zip(names, results) if not ok]
+
+    await sync(
+        "rules", rules,
+        api.get_firewall_rules, api.add_firewall_rule,
+        api.set_firewall_rule, api.remove_firewall_rule,
+    )
+    await sync(
+        "port_forwards", port_forwards,
+        api.get_port_forward_list, api.add_port_forward,
+        api.set_port_forward, api.remove_port_forward,
+    )
+
+    if not dry_run and any(
+        section.get("added") or section.get("updated") or section.get("removed")
+        for section in report.values()
+    ):
+        await coordinator.async_refresh_firewall()
+
+    return report
+
+
 async def register_firewall_services(hass: HomeAssistant, coordinator: GLiNetDataUpdateCoordinator) -> None:
     """Register firewall-related services."""
     
@@ -147,7 +393,7 @@ async def register_firewall_services(hass: HomeAssistant, coordinator: GLiNetDat
         # Remove None values
         rule_params = {k: v for k, v in rule_params.items() if v is not None}
         
-        result = await hass.async_add_executor_job(
+        result = await coordinator.async_add_api_job(
             coordinator.api.add_firewall_rule, rule_params
         )
         if result:
@@ -161,7 +407,7 @@ async def register_firewall_services(hass: HomeAssistant, coordinator: GLiNetDat
         rule_id = call.data.get("rule_id")
         remove_all = call.data.get("remove_all", False)
         
-        result = await hass.async_add_executor_job(
+        result = await coordinator.async_add_api_job(
             coordinator.api.remove_firewall_rule, rule_id, remove_all
         )
         if result is not None:
@@ -185,7 +431,7 @@ async def register_firewall_services(hass: HomeAssistant, coordinator: GLiNetDat
         # Remove None values
         forward_params = {k: v for k, v in forward_params.items() if v is not None}
         
-        result = await hass.async_add_executor_job(
+        result = await coordinator.async_add_api_job(
             coordinator.api.add_port_forward, forward_params
         )
         if result:
@@ -199,7 +445,7 @@ async def register_firewall_services(hass: HomeAssistant, coordinator: GLiNetDat
         rule_id = call.data.get("rule_id")
         remove_all = call.data.get("remove_all", False)
         
-        result = await hass.async_add_executor_job(
+        result = await coordinator.async_add_api_job(
             coordinator.api.remove_port_forward, rule_id, remove_all
         )
         if result is not None:
@@ -213,7 +459,7 @@ async def register_firewall_services(hass: HomeAssistant, coordinator: GLiNetDat
         enabled = call.data["enabled"]
         dest_ip = call.data.get("dest_ip")
         
-        result = await hass.async_add_executor_job(
+        result = await coordinator.async_add_api_job(
             coordinator.api.set_dmz_config, enabled, dest_ip
         )
         if result is not None:
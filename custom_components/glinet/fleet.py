@@ -0,0 +1,232 @@
+"""Services that act on several GL.iNet routers at once."""
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+import voluptuous as vol
+from homeassistant.const import ATTR_AREA_ID, ATTR_DEVICE_ID, ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+
+from .const import DOMAIN, FLEET_CONCURRENCY
+from .coordinator import GLiNetDataUpdateCoordinator
+from .firewall import async_sync_firewall, firewall_sync_succeeded
+
+_LOGGER = logging.getLogger(__name__)
+
+RouterAction = Callable[[GLiNetDataUpdateCoordinator], Awaitable[Any]]
+
+# Target fields, resolved by async_resolve_targets, plus the fan-out width
+FLEET_SERVICE_SCHEMA = vol.Schema(
+    {
+        **cv.ENTITY_SERVICE_FIELDS,
+        vol.Optional("max_concurrency", default=FLEET_CONCURRENCY): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=64)
+        ),
+    }
+)
+
+SET_WIFI_ENABLED_SCHEMA = FLEET_SERVICE_SCHEMA.extend(
+    {
+        vol.Required("iface_name"): cv.string,
+        vol.Required("enabled"): cv.boolean,
+    }
+)
+
+SYNC_FIREWALL_SCHEMA = FLEET_SERVICE_SCHEMA.extend(
+    {
+        vol.Optional("rules"): vol.All(cv.ensure_list, [dict]),
+        vol.Optional("port_forwards"): vol.All(cv.ensure_list, [dict]),
+        vol.Optional("prune", default=True): cv.boolean,
+        vol.Optional("dry_run", default=False): cv.boolean,
+    }
+)
+
+PROFILE_REFRESH_SCHEMA = FLEET_SERVICE_SCHEMA.extend(
+    {
+        vol.Optional("cycles", default=1): vol.All(vol.Coerce(int), vol.Range(min=1, max=20)),
+        vol.Optional("cprofile", default=False): cv.boolean,
+    }
+)
+
+
+@callback
+def async_device_entry_index(hass: HomeAssistant) -> Dict[str, str]:
+    """Return router device id -> config entry id for every loaded router.
+
+    Only the router device itself, identified by ``(DOMAIN, entry_id)``, is
+    indexed; the client devices of the device trackers and the fleet device
+    belong to the same entries but must not stand for the router.
+    """
+    device_registry = dr.async_get(hass)
+    index = {}
+    for entry_id in hass.data.get(DOMAIN, {}):
+        device = device_registry.async_get_device(identifiers={(DOMAIN, entry_id)})
+        if device is not None:
+            index[device.id] = entry_id
+    return index
+
+
+@callback
+def async_resolve_targets(hass: HomeAssistant, call: ServiceCall) -> List[str]:
+    """Return the config entries of the routers a service call targets.
+
+    Devices, areas and entities are resolved through the router device
+    index, so targeting a tracked client's device or entity, or an area that
+    only holds clients, never reaches the router. Without a target the call
+    only resolves when a single router is configured, so a bare call can
+    never reach the whole fleet by accident.
+    """
+    loaded = hass.data.get(DOMAIN, {})
+    device_ids = set(cv.ensure_list(call.data.get(ATTR_DEVICE_ID)))
+    area_ids = set(cv.ensure_list(call.data.get(ATTR_AREA_ID)))
+    entity_ids = set(cv.ensure_list(call.data.get(ATTR_ENTITY_ID)))
+
+    if not device_ids and not area_ids and not entity_ids:
+        if len(loaded) == 1:
+            return list(loaded)
+        raise HomeAssistantError("Select the GL.iNet routers to act on")
+
+    device_registry = dr.async_get(hass)
+    entity_registry = er.async_get(hass)
+    for area_id in area_ids:
+        device_ids.update(
+            device.id for device in dr.async_entries_for_area(device_registry, area_id)
+        )
+        entity_ids.update(
+            entity.entity_id for entity in er.async_entries_for_area(entity_registry, area_id)
+        )
+
+    index = async_device_entry_index(hass)
+    entry_ids: Set[str] = {index[device_id] for device_id in device_ids if device_id in index}
+    for entity_id in entity_ids:
+        entity = entity_registry.async_get(entity_id)
+        # Entities count through the router device they belong to
+        if entity is not None and entity.device_id in index:
+            entry_ids.add(index[entity.device_id])
+    if not entry_ids:
+        raise HomeAssistantError("No GL.iNet router matches the selected targets")
+    return sorted(entry_ids)
+
+
+async def async_fan_out(
+    hass: HomeAssistant,
+    entry_ids: List[str],
+    action: RouterAction,
+    max_concurrency: int,
+    succeeded: Optional[Callable[[Any], bool]] = None,
+) -> Dict[str, Any]:
+    """Run an action on several routers concurrently and report per router.
+
+    ``succeeded`` decides from a router's result whether the action worked;
+    by default anything but None or False counts.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(entry_id: str) -> Dict[str, Any]:
+        coordinator: GLiNetDataUpdateCoordinator = hass.data[DOMAIN][entry_id]
+        entry = hass.config_entries.async_get_entry(entry_id)
+        async with semaphore:
+            started = time.monotonic()
+            try:
+                result = await action(coordinator)
+                error = None
+            except Exception as exc:  # pylint: disable=broad-except
+                _LOGGER.error("Service failed on %s: %s", entry.title, exc)
+                result, error = None, str(exc)
+            latency = time.monotonic() - started
+        report = {
+            "router": entry.title,
+            "host": coordinator.api.active_endpoint,
+            "success": error is None and (
+                succeeded(result) if succeeded else result is not None and result is not False
+            ),
+            "latency_ms": round(latency * 1000),
+        }
+        if error is not None:
+            report["error"] = error
+        elif not isinstance(result, bool):
+            report["result"] = result
+        return report
+
+    started = time.monotonic()
+    reports = await asyncio.gather(*(run(entry_id) for entry_id in entry_ids))
+    succeeded = sum(1 for report in reports if report["success"])
+    return {
+        "routers": dict(zip(entry_ids, reports)),
+        "succeeded": succeeded,
+        "failed": len(reports) - succeeded,
+        "duration_ms": round((time.monotonic() - started) * 1000),
+    }
+
+
+def async_register_fleet_services(hass: HomeAssistant) -> None:
+    """Register services that accept routers as devices, areas or entities."""
+
+    def fleet_handler(
+        make_action: Callable[[ServiceCall], RouterAction],
+        name: str,
+        succeeded: Optional[Callable[[Any], bool]] = None,
+    ):
+        async def handle(call: ServiceCall) -> ServiceResponse:
+            """Handle a fleet service call."""
+            entry_ids = async_resolve_targets(hass, call)
+            report = await async_fan_out(
+                hass, entry_ids, make_action(call), call.data["max_concurrency"], succeeded
+            )
+            _LOGGER.info(
+                "%s finished on %s routers, %s failed", name, len(entry_ids), report["failed"]
+            )
+            if call.return_response:
+                return report
+            return None
+
+        return handle
+
+    def reboot(call: ServiceCall) -> RouterAction:
+        return lambda coordinator: coordinator.async_reboot_system()
+
+    def stop_all_vpns(call: ServiceCall) -> RouterAction:
+        return lambda coordinator: coordinator.async_stop_all_vpns()
+
+    def check_firmware(call: ServiceCall) -> RouterAction:
+        return lambda coordinator: coordinator.async_check_firmware()
+
+    def set_wifi_enabled(call: ServiceCall) -> RouterAction:
+        return lambda coordinator: coordinator.async_set_wifi_enabled(
+            call.data["iface_name"], call.data["enabled"]
+        )
+
+    def sync_firewall(call: ServiceCall) -> RouterAction:
+        return lambda coordinator: async_sync_firewall(
+            hass,
+            coordinator,
+            call.data.get("rules"),
+            call.data.get("port_forwards"),
+            call.data["prune"],
+            call.data["dry_run"],
+        )
+
+    def profile_refresh(call: ServiceCall) -> RouterAction:
+        return lambda coordinator: coordinator.async_trace_refreshes(
+            call.data["cycles"], call.data["cprofile"]
+        )
+
+    services = {
+        "reboot": (reboot, FLEET_SERVICE_SCHEMA, None),
+        "stop_all_vpns": (stop_all_vpns, FLEET_SERVICE_SCHEMA, None),
+        "check_firmware": (check_firmware, FLEET_SERVICE_SCHEMA, None),
+        "set_wifi_enabled": (set_wifi_enabled, SET_WIFI_ENABLED_SCHEMA, None),
+        "sync_firewall": (sync_firewall, SYNC_FIREWALL_SCHEMA, firewall_sync_succeeded),
+        "profile_refresh": (profile_refresh, PROFILE_REFRESH_SCHEMA, None),
+    }
+    for name, (make_action, schema, succeeded) in services.items():
+        hass.services.async_register(
+            DOMAIN, name, fleet_handler(make_action, name, succeeded),
+            schema=schema,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
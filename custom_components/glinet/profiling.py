@@ -0,0 +1,77 @@
+"""Span timings of coordinator refresh cycles, captured on request."""
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+
+class RefreshTracer:
+    """Collect span timings over a number of refresh cycles.
+
+    A tracer only exists while a capture runs. The API, the executor and the
+    coordinator look it up with a single attribute test and skip all timing
+    when it is None, so tracing costs nothing the rest of the time. Spans are
+    added from executor threads as well as the event loop, hence the lock.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no cycle open."""
+        self.cycles: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._spans: Optional[Dict[str, List[float]]] = None
+        self._cycle_start = 0.0
+
+    def start_cycle(self) -> None:
+        """Open a cycle; spans added before this are ignored."""
+        with self._lock:
+            self._spans = {}
+            self._cycle_start = time.perf_counter()
+
+    def add_span(self, name: str, seconds: float, detail: Optional[str] = None) -> None:
+        """Record a span in the open cycle, also under ``name detail`` when given."""
+        with self._lock:
+            if self._spans is None:
+                return
+            self._spans.setdefault(name, []).append(seconds)
+            if detail is not None:
+                self._spans.setdefault(f"{name} {detail}", []).append(seconds)
+
+    def end_cycle(self, error: Optional[str] = None) -> None:
+        """Close the open cycle, if any, and summarize its spans."""
+        with self._lock:
+            if self._spans is None:
+                return
+            cycle: Dict[str, Any] = {
+                "duration_ms": _ms(time.perf_counter() - self._cycle_start),
+                "spans": {name: _summarize(durations) for name, durations in sorted(self._spans.items())},
+            }
+            if error is not None:
+                cycle["error"] = error
+            self.cycles.append(cycle)
+            self._spans = None
+
+    def report(self) -> Dict[str, Any]:
+        """Return every captured cycle and span totals across them."""
+        totals: Dict[str, List[float]] = {}
+        for cycle in self.cycles:
+            for name, span in cycle["spans"].items():
+                total = totals.setdefault(name, [0, 0.0, 0.0])
+                total[0] += span["count"]
+                total[1] += span["total_ms"]
+                total[2] = max(total[2], span["max_ms"])
+        return {
+            "cycles": self.cycles,
+            "totals": {
+                name: {"count": count, "total_ms": round(total_ms, 2), "max_ms": max_ms}
+                for name, (count, total_ms, max_ms) in totals.items()
+            },
+        }
+
+
+def _ms(seconds: float) -> float:
+    """Return seconds as milliseconds rounded for display."""
+    return round(seconds * 1000, 2)
+
+
+def _summarize(durations: List[float]) -> Dict[str, Any]:
+    """Return the count, total and maximum of a span's durations."""
+    return {"count": len(durations), "total_ms": _ms(sum(durations)), "max_ms": _ms(max(durations))}
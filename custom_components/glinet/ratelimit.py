@@ -0,0 +1,115 @@
+"""Router-protective token bucket for GL.iNet RPC calls."""
+import threading
+import time
+from typing import Callable, Optional
+
+# Request priorities, lowest first
+PRIORITY_LOW = 0
+PRIORITY_HIGH = 1
+PRIORITY_WRITE = 2
+
+
+class RouterRateLimiter:
+    """Token bucket shared by every RPC call to one router.
+
+    Calls run in executor threads, so the bucket is guarded by a condition.
+    When the bucket is empty, low priority reads are dropped at once, high
+    priority reads queue for up to ``max_wait`` seconds before being dropped,
+    and writes queue and then go through regardless, as they are user actions.
+    Queued calls are served highest priority first.
+
+    The refill rate adapts to how busy the router says it is: it is scaled
+    down from ``base_rate`` as the load per core or the httpd memory usage
+    climbs, so the integration backs off before the web UI stalls.
+    """
+
+    def __init__(
+        self,
+        base_rate: float,
+        capacity: float,
+        max_wait: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a full bucket."""
+        self.base_rate = base_rate
+        self.rate = base_rate
+        self.capacity = capacity
+        self.max_wait = max_wait
+        self._clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+        self._waiting = [0, 0, 0]
+        self._condition = threading.Condition()
+        self.delayed = 0
+        self.dropped = 0
+
+    def acquire(self, priority: int) -> bool:
+        """Take a token, waiting if the priority allows; return false if dropped."""
+        with self._condition:
+            if priority == PRIORITY_LOW:
+                if self._take(priority, self._clock()):
+                    return True
+                self.dropped += 1
+                return False
+
+            deadline = self._clock() + self.max_wait
+            waited = False
+            self._waiting[priority] += 1
+            try:
+                while True:
+                    now = self._clock()
+                    if self._take(priority, now):
+                        return True
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        if priority == PRIORITY_WRITE:
+                            return True
+                        self.dropped += 1
+                        return False
+                    if not waited:
+                        waited = True
+                        self.delayed += 1
+                    deficit = max(0.0, 1 - self._tokens)
+                    self._condition.wait(min(remaining, max(0.01, deficit / self.rate)))
+            finally:
+                self._waiting[priority] -= 1
+                self._condition.notify_all()
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens earned since the last refill."""
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _take(self, priority: int, now: float) -> bool:
+        """Refill, then take a token unless a higher priority call is queued."""
+        self._refill(now)
+        if self._tokens < 1 or any(self._waiting[priority + 1:]):
+            return False
+        self._tokens -= 1
+        return True
+
+    def adapt(self, load_per_core: Optional[float], httpd_memory_usage: Optional[float]) -> float:
+        """Scale the refill rate to the router's reported load and return it.
+
+        ``httpd_memory_usage`` is the used fraction of the web server's memory.
+        Unknown readings leave their share of the budget untouched.
+        """
+        factor = 1.0
+        if load_per_core is not None:
+            factor = min(factor, _scale(load_per_core, 0.5, 1.5))
+        if httpd_memory_usage is not None:
+            factor = min(factor, _scale(httpd_memory_usage, 0.7, 0.9))
+        with self._condition:
+            self._refill(self._clock())
+            self.rate = self.base_rate * factor
+            self._condition.notify_all()
+        return self.rate
+
+
+def _scale(value: float, relaxed: float, strained: float) -> float:
+    """Return 1 below ``relaxed``, 0.25 above ``strained`` and interpolate between."""
+    if value <= relaxed:
+        return 1.0
+    if value >= strained:
+        return 0.25
+    return 1.0 - 0.75 * (value - relaxed) / (strained - relaxed)
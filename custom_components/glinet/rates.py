@@ -0,0 +1,128 @@
+"""Throughput rates derived from cumulative rx/tx byte counters."""
+import math
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+class RateEngine:
+    """Smoothed byte/s rates for many rx/tx counter sources.
+
+    The previous sample and the current rate of every source live in flat
+    ``array('d')`` columns indexed by slot, so a refresh allocates nothing per
+    source. Rates are an exponentially weighted moving average whose time
+    constant is ``window`` seconds, which keeps irregular refresh intervals
+    from skewing the result.
+    """
+
+    def __init__(self, window: float) -> None:
+        """Initialize the engine."""
+        self.window = window
+        self._slots: Dict[str, int] = {}
+        self._epochs: Dict[str, Any] = {}
+        self._free: List[int] = []
+        self._time = array("d")
+        self._rx = array("d")
+        self._tx = array("d")
+        self._rx_rate = array("d")
+        self._tx_rate = array("d")
+        self._seeded = array("b")
+
+    def __len__(self) -> int:
+        """Return the number of tracked sources."""
+        return len(self._slots)
+
+    def sample(
+        self,
+        source: str,
+        rx_bytes: Optional[float],
+        tx_bytes: Optional[float],
+        now: float,
+        epoch: Any = None,
+    ) -> Optional[Tuple[int, int]]:
+        """Record a counter sample and return the smoothed (rx, tx) byte/s.
+
+        ``epoch`` identifies the thing being counted (e.g. the active tunnel);
+        when it changes the source starts over instead of reporting a jump.
+        Returns None until a source has two samples.
+        """
+        if rx_bytes is None or tx_bytes is None:
+            self.discard(source)
+            return None
+
+        slot = self._slots.get(source)
+        if slot is None or self._epochs.get(source) != epoch:
+            self._seed(source, rx_bytes, tx_bytes, now, epoch)
+            return None
+
+        elapsed = now - self._time[slot]
+        if elapsed <= 0:
+            return self._rates(slot)
+
+        # A counter lower than the last sample was reset by a reconnect,
+        # so everything it holds now was transferred since then.
+        rx_delta = rx_bytes - self._rx[slot]
+        if rx_delta < 0:
+            rx_delta = rx_bytes
+        tx_delta = tx_bytes - self._tx[slot]
+        if tx_delta < 0:
+            tx_delta = tx_bytes
+
+        rx_rate = rx_delta / elapsed
+        tx_rate = tx_delta / elapsed
+        if self._seeded[slot]:
+            alpha = 1 - math.exp(-elapsed / self.window)
+            rx_rate = self._rx_rate[slot] + alpha * (rx_rate - self._rx_rate[slot])
+            tx_rate = self._tx_rate[slot] + alpha * (tx_rate - self._tx_rate[slot])
+
+        self._time[slot] = now
+        self._rx[slot] = rx_bytes
+        self._tx[slot] = tx_bytes
+        self._rx_rate[slot] = rx_rate
+        self._tx_rate[slot] = tx_rate
+        self._seeded[slot] = 1
+        return self._rates(slot)
+
+    def get(self, source: str) -> Optional[Tuple[int, int]]:
+        """Return the last smoothed (rx, tx) byte/s for a source."""
+        slot = self._slots.get(source)
+        if slot is None or not self._seeded[slot]:
+            return None
+        return self._rates(slot)
+
+    def discard(self, source: str) -> None:
+        """Stop tracking a source and free its slot."""
+        slot = self._slots.pop(source, None)
+        if slot is not None:
+            self._epochs.pop(source, None)
+            self._free.append(slot)
+
+    def retain(self, sources: Iterable[str], prefix: str) -> None:
+        """Discard sources starting with ``prefix`` that are not in ``sources``."""
+        keep = set(sources)
+        for source in [s for s in self._slots if s.startswith(prefix) and s not in keep]:
+            self.discard(source)
+
+    def _seed(self, source: str, rx_bytes: float, tx_bytes: float, now: float, epoch: Any) -> None:
+        """Store the first sample of a source."""
+        slot = self._slots.get(source)
+        if slot is None:
+            if self._free:
+                slot = self._free.pop()
+            else:
+                slot = len(self._time)
+                for column in (self._time, self._rx, self._tx, self._rx_rate, self._tx_rate):
+                    column.append(0.0)
+                self._seeded.append(0)
+            self._slots[source] = slot
+
+        self._epochs[source] = epoch
+        self._time[slot] = now
+        self._rx[slot] = rx_bytes
+        self._tx[slot] = tx_bytes
+        self._rx_rate[slot] = 0.0
+        self._tx_rate[slot] = 0.0
+        self._seeded[slot] = 0
+
+    def _rates(self, slot: int) -> Tuple[int, int]:
+        """Return the rounded rates stored in a slot."""
+        return round(self._rx_rate[slot]), round(self._tx_rate[slot])
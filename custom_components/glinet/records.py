@@ -0,0 +1,246 @@
+"""Compact records projected from GL.iNet router responses.
+
+Each record declares, through ``__slots__``, the only fields the integration
+reads from an endpoint. Everything else in the response (WiFi passphrases,
+private keys, unused nesting) is dropped at ingestion, so it never sits in
+the coordinator snapshot, memory dumps or diagnostics.
+"""
+import sys
+from typing import Any, Callable, Dict, Iterable, Optional, Set, Tuple, TypeVar
+
+_MISSING = object()
+
+
+class Record:
+    """Slotted record with the dict-style read access entities already use."""
+
+    __slots__ = ()
+
+    # Fields whose string values are interned, so the same MAC or interface
+    # name shares one string object across records and refreshes
+    _interned: Tuple[str, ...] = ()
+
+    def __init__(self, data: Optional[Dict[str, Any]] = None) -> None:
+        """Project the declared fields out of a response dict."""
+        if data:
+            self.update(data)
+
+    def update(self, data: Dict[str, Any]) -> bool:
+        """Update the declared fields in place and return true if any changed."""
+        changed = False
+        for field in self.__slots__:
+            value = data.get(field, _MISSING)
+            if value is _MISSING:
+                if hasattr(self, field):
+                    delattr(self, field)
+                    changed = True
+                continue
+            if field in self._interned and isinstance(value, str):
+                value = sys.intern(self._normalize(field, value))
+            if getattr(self, field, _MISSING) != value:
+                setattr(self, field, value)
+                changed = True
+        return changed
+
+    def _normalize(self, field: str, value: str) -> str:
+        """Normalize an interned string field before interning it."""
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return a field, or ``default`` when it is not declared or not set."""
+        if key not in self.__slots__:
+            return default
+        return getattr(self, key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        """Return a field, raising KeyError when it is missing."""
+        try:
+            if key in self.__slots__:
+                return getattr(self, key)
+        except AttributeError:
+            pass
+        raise KeyError(key)
+
+    def __contains__(self, key: str) -> bool:
+        """Return true if a field is set."""
+        return key in self.__slots__ and hasattr(self, key)
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare records field by field."""
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._values() == other._values()
+
+    def __repr__(self) -> str:
+        """Return a readable representation."""
+        return f"{type(self).__name__}({self.as_dict()!r})"
+
+    def _values(self) -> Tuple[Any, ...]:
+        """Return the field values in slot order."""
+        return tuple(getattr(self, field, None) for field in self.__slots__)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the set fields as a plain dict, recursing into nested records."""
+        result = {}
+        for field in self.__slots__:
+            if hasattr(self, field):
+                result[field] = _plain(getattr(self, field))
+        return result
+
+
+def _plain(value: Any) -> Any:
+    """Convert records nested in tuples and lists to plain data."""
+    if isinstance(value, Record):
+        return value.as_dict()
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+    return value
+
+
+RecordT = TypeVar("RecordT", bound=Record)
+
+
+def merge_records(
+    index: Dict[str, RecordT],
+    items: Iterable[Dict[str, Any]],
+    record_type: Callable[[Dict[str, Any]], RecordT],
+    key: Callable[[Dict[str, Any]], Optional[str]],
+) -> Tuple[Dict[str, RecordT], Set[str]]:
+    """Update an index of records in place from a fresh list of response items.
+
+    Records that are still present keep their identity, so entities holding a
+    record see new values without being handed a new object. Returns the new
+    index and the keys that were added, changed or removed.
+    """
+    merged: Dict[str, RecordT] = {}
+    changed: Set[str] = set()
+    for item in items:
+        item_key = key(item)
+        if not item_key:
+            continue
+        record = index.get(item_key)
+        if record is None:
+            record = record_type(item)
+            changed.add(item_key)
+        elif record.update(item):
+            changed.add(item_key)
+        merged[item_key] = record
+    changed.update(index.keys() - merged.keys())
+    return merged, changed
+
+
+class ClientRecord(Record):
+    """A client from ``clients.get_list``."""
+
+    __slots__ = (
+        "mac", "name", "ip", "iface", "online", "remote", "vendor",
+        "total_rx", "total_tx", "rx", "tx",
+    )
+    _interned = ("mac", "iface")
+
+    def _normalize(self, field: str, value: str) -> str:
+        """Store MAC addresses upper-case."""
+        return value.upper() if field == "mac" else value
+
+
+class VPNProfile(Record):
+    """A VPN client profile from ``get_all_config_list``."""
+
+    __slots__ = ("name", "group_id", "group_name", "peer_id", "client_id", "type")
+    _interned = ("type",)
+
+
+class NetworkInterface(Record):
+    """A network interface from the ``network`` list of ``system.get_status``."""
+
+    __slots__ = ("interface", "up", "online")
+    _interned = ("interface",)
+
+
+class WireGuardPeer(Record):
+    """A row of the WireGuard server peer table."""
+
+    __slots__ = (
+        "peer_id", "name", "connected", "enabled", "private_ip", "public_ip",
+        "latest_handshake", "rx_bytes", "tx_bytes", "rx_rate", "tx_rate",
+    )
+
+
+def client_key(client: Dict[str, Any]) -> Optional[str]:
+    """Return the index key of a client."""
+    mac = client.get("mac")
+    return mac.upper() if mac else None
+
+
+def vpn_profile_key(profile: Dict[str, Any]) -> Optional[str]:
+    """Return the index key of a VPN profile."""
+    profile_id = profile.get("peer_id") if profile.get("type") == "wg" else profile.get("client_id")
+    return f"{profile.get('type')}:{profile.get('group_id')}:{profile_id}"
+
+
+class WifiInterface(Record):
+    """A WiFi interface (SSID) from ``wifi.get_config``."""
+
+    __slots__ = ("name", "ssid", "enabled", "guest", "hidden", "encryption")
+
+
+class WifiDevice(Record):
+    """A radio from ``wifi.get_config``, with its interfaces."""
+
+    __slots__ = ("device", "band", "channel", "htmode", "hwmode", "txpower", "ifaces")
+
+    def __init__(self, data: Optional[Dict[str, Any]] = None) -> None:
+        """Project the radio and its interfaces."""
+        super().__init__(data)
+        self.ifaces = tuple(WifiInterface(iface) for iface in (data or {}).get("ifaces", []))
+
+
+class WifiConfig(Record):
+    """Projection of ``wifi.get_config``."""
+
+    __slots__ = ("res",)
+
+    def __init__(self, data: Optional[Dict[str, Any]] = None) -> None:
+        """Project every radio in the response."""
+        self.res = tuple(WifiDevice(device) for device in (data or {}).get("res", []))
+
+
+class WireGuardServerConfig(Record):
+    """Projection of ``wg-server.get_config``, without keys other than the public one."""
+
+    __slots__ = ("port", "public_key", "ipv6_enable")
+
+
+class ZoneList(Record):
+    """Projection of ``firewall.get_zone_list`` to zone names."""
+
+    __slots__ = ("internals", "externals")
+
+    def __init__(self, data: Optional[Dict[str, Any]] = None) -> None:
+        """Keep only the zone names."""
+        data = data or {}
+        self.internals = _zone_names(data.get("internals", []))
+        self.externals = _zone_names(data.get("externals", []))
+
+
+def _zone_names(zones: Iterable[Any]) -> Tuple[str, ...]:
+    """Return zone names from a list of names or zone dicts."""
+    return tuple(zone.get("name") if isinstance(zone, dict) else zone for zone in zones)
+
+
+# Response key in the coordinator snapshot -> record type it is projected to
+PROJECTIONS = {
+    "wifi_config": WifiConfig,
+    "wg_server_config": WireGuardServerConfig,
+    "zone_list": ZoneList,
+}
+
+
+def project(key: str, response: Optional[Dict[str, Any]]) -> Any:
+    """Project a router response into its record type, if it has one."""
+    record_type = PROJECTIONS.get(key)
+    if record_type is None:
+        return response
+    if response is None:
+        return record_type()
+    return record_type(response)
@@ -0,0 +1,195 @@
+"""High-resolution sampling imported into long-term statistics for GL.iNet."""
+import logging
+import time
+from array import array
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import PERCENTAGE, UnitOfDataRate
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.util import slugify
+
+from .const import DOMAIN, HIGH_RES_FLUSH_INTERVAL, HIGH_RES_SAMPLE_INTERVAL
+from .coordinator import GLiNetDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# metric -> (name suffix, unit)
+SAMPLED_METRICS = {
+    "cpu_load": ("CPU Load (high resolution)", None),
+    "memory_usage": ("Memory Usage (high resolution)", PERCENTAGE),
+    "vpn_rx_rate": ("VPN Download Rate (high resolution)", UnitOfDataRate.BYTES_PER_SECOND),
+    "vpn_tx_rate": ("VPN Upload Rate (high resolution)", UnitOfDataRate.BYTES_PER_SECOND),
+}
+
+
+class HighResolutionSampler:
+    """Sample load, memory and VPN throughput every few seconds.
+
+    Samples are appended to ``array('d')`` buffers without touching the state
+    machine. Every few minutes the buffers are folded into hourly
+    mean/min/max accumulators, and the touched hours are imported as external
+    statistics, overwriting the partial hour imported by the previous flush.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: GLiNetDataUpdateCoordinator,
+        entry: ConfigEntry,
+    ) -> None:
+        """Initialize the sampler."""
+        self.hass = hass
+        self.coordinator = coordinator
+        self.entry = entry
+        self._statistic_prefix = f"{DOMAIN}:{slugify(entry.unique_id or entry.entry_id)}"
+        self._times = {metric: array("d") for metric in SAMPLED_METRICS}
+        self._values = {metric: array("d") for metric in SAMPLED_METRICS}
+        # metric -> hour start timestamp -> [count, sum, min, max]
+        self._hours: Dict[str, Dict[float, List[float]]] = {metric: {} for metric in SAMPLED_METRICS}
+        self._vpn_counters: Optional[tuple] = None
+        self._sampling = False
+        self._ticks = 0
+        self._unsubs: List[Callable[[], None]] = []
+
+    @callback
+    def async_start(self) -> None:
+        """Start sampling and periodic flushing."""
+        self._unsubs.append(async_track_time_interval(
+            self.hass, self._async_sample, timedelta(seconds=HIGH_RES_SAMPLE_INTERVAL)
+        ))
+        self._unsubs.append(async_track_time_interval(
+            self.hass, self._async_flush, timedelta(seconds=HIGH_RES_FLUSH_INTERVAL)
+        ))
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop sampling and flush what is buffered."""
+        while self._unsubs:
+            self._unsubs.pop()()
+        self._flush()
+
+    async def _async_sample(self, _now: datetime) -> None:
+        """Take one sample of every metric."""
+        if self._sampling:
+            # The router is slower than the sample interval; skip this tick
+            return
+        self._ticks += 1
+        if self._ticks % self.coordinator.power_interval_factor:
+            # Sample less often on battery, like the regular refresh
+            return
+        self._sampling = True
+        try:
+            load_info = await self.coordinator.async_add_api_job(self.coordinator.api.get_load)
+            vpn_type = self._active_vpn_type()
+            vpn_status = None
+            if vpn_type:
+                vpn_status = await self.coordinator.async_add_api_job(
+                    self.coordinator.api.get_vpn_status, vpn_type
+                )
+        finally:
+            self._sampling = False
+
+        now = time.time()
+        if load_info:
+            load_average = load_info.get("load_average") or []
+            if load_average:
+                self._append("cpu_load", now, load_average[0])
+            total = load_info.get("memory_total") or 0
+            free = load_info.get("memory_free") or 0
+            if total > 0:
+                self._append("memory_usage", now, (total - free) / total * 100)
+
+        self._sample_vpn(vpn_status, now)
+
+    def _active_vpn_type(self) -> Optional[str]:
+        """Return the type of the active VPN client tunnel, if any."""
+        vpn_status = self.coordinator.data.get("vpn_status") or {}
+        if vpn_status.get("status") != 1:
+            return None
+        if vpn_status.get("peer_id") is not None:
+            return "wg"
+        if vpn_status.get("client_id") is not None:
+            return "ovpn"
+        return None
+
+    def _sample_vpn(self, vpn_status: Optional[Dict[str, Any]], now: float) -> None:
+        """Turn VPN byte counters into rate samples."""
+        if not vpn_status or vpn_status.get("status") != 1:
+            self._vpn_counters = None
+            return
+
+        rx_bytes = vpn_status.get("rx_bytes") or 0
+        tx_bytes = vpn_status.get("tx_bytes") or 0
+        previous = self._vpn_counters
+        self._vpn_counters = (now, rx_bytes, tx_bytes)
+        if previous is None or now <= previous[0]:
+            return
+
+        elapsed = now - previous[0]
+        # Counters restart from zero after a reconnect
+        rx_delta = rx_bytes - previous[1] if rx_bytes >= previous[1] else rx_bytes
+        tx_delta = tx_bytes - previous[2] if tx_bytes >= previous[2] else tx_bytes
+        self._append("vpn_rx_rate", now, rx_delta / elapsed)
+        self._append("vpn_tx_rate", now, tx_delta / elapsed)
+
+    def _append(self, metric: str, timestamp: float, value: float) -> None:
+        """Buffer a sample."""
+        self._times[metric].append(timestamp)
+        self._values[metric].append(value)
+
+    async def _async_flush(self, _now: datetime) -> None:
+        """Flush buffered samples on the flush interval."""
+        self._flush()
+
+    @callback
+    def _flush(self) -> None:
+        """Fold buffered samples into hourly buckets and import them."""
+        current_hour = time.time() // 3600 * 3600
+        for metric, (name, unit) in SAMPLED_METRICS.items():
+            times, values = self._times[metric], self._values[metric]
+            if not times:
+                continue
+
+            hours = self._hours[metric]
+            touched = set()
+            for timestamp, value in zip(times, values):
+                hour = timestamp // 3600 * 3600
+                touched.add(hour)
+                bucket = hours.get(hour)
+                if bucket is None:
+                    hours[hour] = [1, value, value, value]
+                else:
+                    bucket[0] += 1
+                    bucket[1] += value
+                    bucket[2] = min(bucket[2], value)
+                    bucket[3] = max(bucket[3], value)
+            del times[:]
+            del values[:]
+
+            statistics = []
+            for hour in sorted(touched):
+                count, total, minimum, maximum = hours[hour]
+                statistics.append(StatisticData(
+                    start=datetime.fromtimestamp(hour, tz=timezone.utc),
+                    mean=total / count,
+                    min=minimum,
+                    max=maximum,
+                ))
+            metadata = StatisticMetaData(
+                has_mean=True,
+                has_sum=False,
+                name=f"{self.entry.title} {name}",
+                source=DOMAIN,
+                statistic_id=f"{self._statistic_prefix}_{metric}",
+                unit_of_measurement=unit,
+            )
+            async_add_external_statistics(self.hass, metadata, statistics)
+
+            # Completed hours have been imported for the last time
+            for hour in [hour for hour in hours if hour < current_hour]:
+                del hours[hour]
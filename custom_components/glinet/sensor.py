@@ -1,7 +1,9 @@
 """Sensor platform for GL.iNet integration."""
 import logging
+import time
 from typing import Any, Dict, Optional
 
+import voluptuous as vol
 from homeassistant.components.sensor import (
     SensorEntity, 
     SensorEntityDescription,
@@ -11,16 +13,33 @@ from homeassistant.components.sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     PERCENTAGE,
+    EntityCategory,
+    UnitOfDataRate,
     UnitOfInformation,
     UnitOfTemperature,
     UnitOfTime
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MANUFACTURER
+from .aggregate import async_setup_fleet_sensors
+from .const import (
+    CAPABILITY_BATTERY,
+    CAPABILITY_CPU_TEMPERATURE,
+    DATA_ROUTER_SENSORS,
+    DEFAULT_TOP_TALKERS,
+    DOMAIN,
+    MANUFACTURER,
+    POWER_PROFILE_INTERVAL_FACTORS,
+    TRAFFIC_WINDOWS,
+)
 from .coordinator import GLiNetDataUpdateCoordinator
+from .filters import build_publish_filter
+from .fleet import async_resolve_targets
+from .wireguard import async_setup_wg_peer_entities, wg_peer_sensors
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -246,6 +265,97 @@ SENSOR_DESCRIPTIONS = [
         icon="mdi:vpn",
     ),
     
+    # Throughput rates from tunnel byte counters
+    SensorEntityDescription(
+        key="vpn_client_rx_rate",
+        name="VPN Client Download Rate",
+        icon="mdi:download-network",
+        device_class=SensorDeviceClass.DATA_RATE,
+        native_unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="vpn_client_tx_rate",
+        name="VPN Client Upload Rate",
+        icon="mdi:upload-network",
+        device_class=SensorDeviceClass.DATA_RATE,
+        native_unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="wg_server_rx_rate",
+        name="WireGuard Server Download Rate",
+        icon="mdi:download-network",
+        device_class=SensorDeviceClass.DATA_RATE,
+        native_unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="wg_server_tx_rate",
+        name="WireGuard Server Upload Rate",
+        icon="mdi:upload-network",
+        device_class=SensorDeviceClass.DATA_RATE,
+        native_unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="ovpn_server_rx_rate",
+        name="OpenVPN Server Download Rate",
+        icon="mdi:download-network",
+        device_class=SensorDeviceClass.DATA_RATE,
+        native_unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="ovpn_server_tx_rate",
+        name="OpenVPN Server Upload Rate",
+        icon="mdi:upload-network",
+        device_class=SensorDeviceClass.DATA_RATE,
+        native_unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    
+    # Top bandwidth consumer among clients
+    SensorEntityDescription(
+        key="top_talker",
+        name="Top Bandwidth Client",
+        icon="mdi:chart-bar",
+    ),
+    
+    # Polling profile of battery routers
+    SensorEntityDescription(
+        key="power_profile",
+        name="Power Profile",
+        icon="mdi:battery-clock",
+        device_class=SensorDeviceClass.ENUM,
+        options=list(POWER_PROFILE_INTERVAL_FACTORS),
+    ),
+    
+    # RPC thread pool of this router
+    SensorEntityDescription(
+        key="rpc_queue_depth",
+        name="RPC Queue Depth",
+        icon="mdi:tray-full",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="rpc_pool_saturation",
+        name="RPC Pool Saturation",
+        icon="mdi:gauge-full",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    
+    # Router address in use when several are configured
+    SensorEntityDescription(
+        key="active_endpoint",
+        name="Active Endpoint",
+        icon="mdi:router-network",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    
     # WiFi Status
     SensorEntityDescription(
         key="wifi_devices_status",
@@ -255,6 +365,29 @@ SENSOR_DESCRIPTIONS = [
 ]
 
 
+# Sensors whose attributes are also served by the get_router_details service
+DETAIL_SENSOR_KEYS = [
+    "network_interfaces",
+    "wifi_status",
+    "services_status",
+    "system_info",
+    "disk_info",
+    "firewall_zones",
+    "wifi_devices_status",
+]
+
+
+# Sensors that only exist on routers with a given hardware capability
+SENSOR_CAPABILITIES = {
+    "cpu_temperature": CAPABILITY_CPU_TEMPERATURE,
+    "battery_level": CAPABILITY_BATTERY,
+    "battery_temperature": CAPABILITY_BATTERY,
+    "battery_charging": CAPABILITY_BATTERY,
+    "battery_cycles": CAPABILITY_BATTERY,
+    "power_profile": CAPABILITY_BATTERY,
+}
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -262,17 +395,150 @@ async def async_setup_entry(
 ) -> None:
     """Set up GL.iNet sensors."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
+    sensors: Dict[str, GLiNetSensor] = {}
+    
+    @callback
+    def add_supported_sensors() -> None:
+        """Add sensors whose hardware capability is present and not yet added."""
+        capabilities = coordinator.detect_capabilities()
+        entities = []
+        for description in SENSOR_DESCRIPTIONS:
+            if description.key in sensors:
+                continue
+            capability = SENSOR_CAPABILITIES.get(description.key)
+            if capability and capability not in capabilities:
+                continue
+            sensors[description.key] = GLiNetSensor(coordinator, description, entry)
+            entities.append(sensors[description.key])
+        
+        if entities:
+            async_add_entities(entities)
+    
+    add_supported_sensors()
+    _remove_unsupported_sensors(hass, coordinator, entry, sensors)
     
-    entities = []
-    for description in SENSOR_DESCRIPTIONS:
-        entities.append(GLiNetSensor(coordinator, description, entry))
+    # Capabilities can show up later, e.g. once a battery MCU reports in
+    entry.async_on_unload(coordinator.async_add_listener(add_supported_sensors))
     
-    async_add_entities(entities)
+    # Per-peer WireGuard server sensors
+    async_setup_wg_peer_entities(hass, coordinator, entry, async_add_entities, wg_peer_sensors)
+    
+    # Fleet summary sensors, on the router that enabled them
+    async_setup_fleet_sensors(hass, entry, async_add_entities)
+    
+    router_sensors = hass.data.setdefault(DATA_ROUTER_SENSORS, {})
+    router_sensors[entry.entry_id] = sensors
+    entry.async_on_unload(lambda: router_sensors.pop(entry.entry_id, None))
+    register_sensor_services(hass)
+
+
+@callback
+def _remove_unsupported_sensors(
+    hass: HomeAssistant,
+    coordinator: GLiNetDataUpdateCoordinator,
+    entry: ConfigEntry,
+    sensors: Dict[str, "GLiNetSensor"],
+) -> None:
+    """Drop registry entries of capability sensors this router does not have.
+
+    Only a status that was actually read can show a capability is absent; a
+    failed or dropped read leaves the entries, and their customizations, alone.
+    """
+    if not ((coordinator.data or {}).get("system_status") or {}).get("system"):
+        return
+    registry = er.async_get(hass)
+    for key in SENSOR_CAPABILITIES.keys() - sensors.keys():
+        entity_id = registry.async_get_entity_id("sensor", DOMAIN, f"{entry.entry_id}_{key}")
+        if entity_id:
+            registry.async_remove(entity_id)
+
+
+GET_TOP_TALKERS_SCHEMA = vol.Schema(
+    {
+        **cv.ENTITY_SERVICE_FIELDS,
+        vol.Optional("window", default=next(iter(TRAFFIC_WINDOWS))): vol.In(list(TRAFFIC_WINDOWS)),
+        vol.Optional("count", default=DEFAULT_TOP_TALKERS): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=50)
+        ),
+    }
+)
+
+
+GET_ROUTER_DETAILS_SCHEMA = vol.Schema(
+    {
+        **cv.ENTITY_SERVICE_FIELDS,
+        vol.Optional("sections"): vol.All(cv.ensure_list, [vol.In(DETAIL_SENSOR_KEYS)]),
+    }
+)
+
+
+@callback
+def register_sensor_services(hass: HomeAssistant) -> None:
+    """Register services that return sensor data on demand, once for all routers."""
+    if hass.services.has_service(DOMAIN, "get_top_talkers"):
+        return
+
+    async def handle_get_top_talkers(call: ServiceCall) -> ServiceResponse:
+        """Handle get top talkers service."""
+        window = call.data["window"]
+        routers = {}
+        for entry_id in async_resolve_targets(hass, call):
+            coordinator: GLiNetDataUpdateCoordinator = hass.data[DOMAIN][entry_id]
+            routers[entry_id] = {
+                "router": coordinator.config_entry.title,
+                "talkers": coordinator.client_traffic.top(window, call.data["count"]),
+            }
+        return {"window": window, "routers": routers}
+
+    async def handle_get_router_details(call: ServiceCall) -> ServiceResponse:
+        """Handle get router details service."""
+        sections = call.data.get("sections") or DETAIL_SENSOR_KEYS
+        routers = {}
+        for entry_id in async_resolve_targets(hass, call):
+            sensors_by_key = hass.data[DATA_ROUTER_SENSORS].get(entry_id, {})
+            routers[entry_id] = {
+                "router": hass.data[DOMAIN][entry_id].config_entry.title,
+                **{
+                    key: sensors_by_key[key].extra_state_attributes
+                    for key in sections
+                    if key in sensors_by_key
+                },
+            }
+        return {"routers": routers}
+
+    hass.services.async_register(
+        DOMAIN, "get_top_talkers", handle_get_top_talkers,
+        schema=GET_TOP_TALKERS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN, "get_router_details", handle_get_router_details,
+        schema=GET_ROUTER_DETAILS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
 
 
 class GLiNetSensor(CoordinatorEntity, SensorEntity):
     """Representation of a GL.iNet sensor."""
 
+    # Bulky attributes stay in the state machine but are not written to the recorder
+    _unrecorded_attributes = frozenset({
+        "interfaces",
+        "networks",
+        "services",
+        "devices",
+        "talkers",
+        "root",
+        "tmp",
+        "sn",
+        "country_code",
+        "architecture",
+        "kernel_version",
+        "openwrt_version",
+        "zones",
+        "log",
+    })
+
     def __init__(
         self,
         coordinator: GLiNetDataUpdateCoordinator,
@@ -282,6 +548,8 @@ class GLiNetSensor(CoordinatorEntity, SensorEntity):
         """Initialize the sensor."""
         super().__init__(coordinator)
         self.entity_description = description
+        self._publish_filter = build_publish_filter(description.key, entry.options)
+        self._last_available: Optional[bool] = None
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
         self._attr_device_info = {
             "identifiers": {(DOMAIN, entry.entry_id)},
@@ -291,6 +559,19 @@ class GLiNetSensor(CoordinatorEntity, SensorEntity):
             "sw_version": coordinator.data.get("system_info", {}).get("firmware_version", "Unknown"),
         }
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state unless the publish filter holds back a small change."""
+        available = self.available
+        if self._publish_filter is not None:
+            now = time.monotonic()
+            value = self.native_value
+            if available == self._last_available and not self._publish_filter.should_publish(value, now):
+                return
+            self._publish_filter.published(value, now)
+        self._last_available = available
+        self.async_write_ha_state()
+
     @property
     def native_value(self) -> Any:
         """Return the state of the sensor."""
@@ -298,8 +579,6 @@ class GLiNetSensor(CoordinatorEntity, SensorEntity):
         system_info = self.coordinator.data.get("system_info", {})
         disk_info = self.coordinator.data.get("disk_info", {})
         vpn_status = self.coordinator.data.get("vpn_status", {})
-        firewall_rules = self.coordinator.data.get("firewall_rules", {})
-        port_forwards = self.coordinator.data.get("port_forwards", {})
         dmz_config = self.coordinator.data.get("dmz", {})
         zone_list = self.coordinator.data.get("zone_list", {})
         wg_server_status = self.coordinator.data.get("wg_server_status", {})
@@ -446,12 +725,10 @@ class GLiNetSensor(CoordinatorEntity, SensorEntity):
         
         # Firewall sensors
         elif key == "firewall_rules_count":
-            rules = firewall_rules.get("res", [])
-            return len(rules)
+            return len(self.coordinator.firewall_rule_index)
         
         elif key == "port_forwards_count":
-            forwards = port_forwards.get("res", [])
-            return len(forwards)
+            return len(self.coordinator.port_forward_index)
         
         elif key == "dmz_status":
             if dmz_config.get("enabled"):
@@ -474,9 +751,8 @@ class GLiNetSensor(CoordinatorEntity, SensorEntity):
             return "Stopped"
         
         elif key == "wg_server_peers":
-            peers = wg_server_status.get("peers", [])
-            connected = len([p for p in peers if p.get("status") == 1])
-            return connected
+            peers = self.coordinator.wg_peer_index.values()
+            return sum(1 for peer in peers if peer["connected"])
         
         elif key == "ovpn_server_status":
             if ovpn_server_status.get("status", 0) == 1:
@@ -485,6 +761,30 @@ class GLiNetSensor(CoordinatorEntity, SensorEntity):
                 return "Initialized"
             return "Stopped"
         
+        elif key.endswith("_rx_rate") or key.endswith("_tx_rate"):
+            rates = self.coordinator.rates.get(key[:-8])
+            if rates is None:
+                return None
+            return rates[0] if key.endswith("_rx_rate") else rates[1]
+        
+        elif key == "top_talker":
+            top_talkers = self.coordinator.top_talkers
+            if not top_talkers:
+                return None
+            return top_talkers[0]["name"] or top_talkers[0]["ip"] or top_talkers[0]["mac"]
+        
+        elif key == "power_profile":
+            return self.coordinator.power_profile
+        
+        elif key == "active_endpoint":
+            return self.coordinator.api.active_endpoint
+        
+        elif key == "rpc_queue_depth":
+            return self.coordinator.data.get("executor_stats", {}).get("peak_queue_depth")
+        
+        elif key == "rpc_pool_saturation":
+            return self.coordinator.data.get("executor_stats", {}).get("saturation")
+        
         elif key == "wifi_devices_status":
             devices = wifi_status_detail.get("res", [])
             ready_count = sum(1 for d in devices if d.get("state") == "ready")
@@ -499,8 +799,6 @@ class GLiNetSensor(CoordinatorEntity, SensorEntity):
         system_info = self.coordinator.data.get("system_info", {})
         disk_info = self.coordinator.data.get("disk_info", {})
         vpn_status = self.coordinator.data.get("vpn_status", {})
-        firewall_rules = self.coordinator.data.get("firewall_rules", {})
-        port_forwards = self.coordinator.data.get("port_forwards", {})
         dmz_config = self.coordinator.data.get("dmz", {})
         zone_list = self.coordinator.data.get("zone_list", {})
         wg_server_status = self.coordinator.data.get("wg_server_status", {})
@@ -531,7 +829,7 @@ class GLiNetSensor(CoordinatorEntity, SensorEntity):
                     "up": iface.get("up", False),
                     "online": iface.get("online", False)
                 }
-            return interfaces
+            return {"interfaces": interfaces}
         
         elif key == "wifi_status":
             wifi = system_status.get("wifi", [])
@@ -546,7 +844,7 @@ class GLiNetSensor(CoordinatorEntity, SensorEntity):
                     "guest": w.get("guest", False),
                     "password": w.get("passwd", "***") if w.get("passwd") else None
                 }
-            return wifi_info
+            return {"networks": wifi_info}
         
         elif key == "services_status":
             services = system_status.get("service", [])
@@ -561,7 +859,7 @@ class GLiNetSensor(CoordinatorEntity, SensorEntity):
                     "client_id": svc.get("client_id"),
                     "peer_id": svc.get("peer_id")
                 }
-            return service_info
+            return {"services": service_info}
         
         elif key == "system_info":
             return {
@@ -625,19 +923,11 @@ class GLiNetSensor(CoordinatorEntity, SensorEntity):
             }
         
         # Firewall attributes
-        elif key == "firewall_rules_count":
-            rules = firewall_rules.get("res", [])
-            return {"rules": rules}
-        
-        elif key == "port_forwards_count":
-            forwards = port_forwards.get("res", [])
-            return {"forwards": forwards}
-        
         elif key == "dmz_status":
             return dmz_config
         
         elif key == "firewall_zones":
-            return zone_list
+            return {"zones": zone_list.as_dict()}
         
         # VPN Server attributes
         elif key == "wg_server_status":
@@ -653,19 +943,8 @@ class GLiNetSensor(CoordinatorEntity, SensorEntity):
             }
         
         elif key == "wg_server_peers":
-            peers = wg_server_status.get("peers", [])
-            peer_info = {}
-            for peer in peers:
-                name = peer.get("name", "unknown")
-                peer_info[name] = {
-                    "status": "Online" if peer.get("status") == 1 else "Offline",
-                    "private_ip": peer.get("private_ip"),
-                    "public_ip": peer.get("public_ip"),
-                    "latest_handshake": peer.get("latest_handshake"),
-                    "rx_bytes": peer.get("rx_bytes"),
-                    "tx_bytes": peer.get("tx_bytes"),
-                }
-            return {"peers": peer_info}
+            # Per-peer details live on the WireGuard peer entities
+            return {"total_peers": len(self.coordinator.wg_peer_index)}
         
         elif key == "ovpn_server_status":
             return {
@@ -676,6 +955,27 @@ class GLiNetSensor(CoordinatorEntity, SensorEntity):
                 "log": ovpn_server_status.get("log"),
             }
         
+        elif key == "top_talker":
+            return {
+                "window": next(iter(TRAFFIC_WINDOWS)),
+                "talkers": self.coordinator.top_talkers,
+            }
+        
+        elif key == "active_endpoint":
+            return {
+                "rtt_ms": dict(self.coordinator.api.endpoint_rtt),
+            }
+        
+        elif key in ["rpc_queue_depth", "rpc_pool_saturation"]:
+            return self.coordinator.data.get("executor_stats", {})
+        
+        elif key == "power_profile":
+            return {
+                "update_interval": self.coordinator.update_interval.total_seconds(),
+                "low_battery_threshold": self.coordinator.low_battery_threshold,
+                "critical_battery_threshold": self.coordinator.critical_battery_threshold,
+            }
+        
         elif key == "wifi_devices_status":
             devices = wifi_status_detail.get("res", [])
             device_info = {}
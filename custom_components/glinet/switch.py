@@ -10,7 +10,13 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, MANUFACTURER
 from .coordinator import GLiNetDataUpdateCoordinator
-from .firewall import GLiNetDMZSwitch, GLiNetWANAccessSwitch, register_firewall_services
+from .firewall import (
+    GLiNetDMZSwitch,
+    GLiNetWANAccessSwitch,
+    async_setup_firewall_rule_switches,
+    register_firewall_services,
+)
+from .wireguard import async_setup_wg_peer_entities, wg_peer_switches
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -53,6 +59,12 @@ async def async_setup_entry(
     
     async_add_entities(entities)
     
+    # Per-rule firewall and port forward switches, added and removed as rules change
+    async_setup_firewall_rule_switches(hass, coordinator, entry, async_add_entities)
+    
+    # Per-peer WireGuard server switches
+    async_setup_wg_peer_entities(hass, coordinator, entry, async_add_entities, wg_peer_switches)
+    
     # Register firewall services
     await register_firewall_services(hass, coordinator)
 
@@ -178,8 +190,8 @@ class GLiNetWireGuardServerSwitch(CoordinatorEntity, SwitchEntity):
         }
         
         # Add peer information
-        peers = wg_status.get("peers", [])
-        attrs["connected_peers"] = len([p for p in peers if p.get("status") == 1])
+        peers = self.coordinator.wg_peer_index.values()
+        attrs["connected_peers"] = sum(1 for peer in peers if peer["connected"])
         attrs["total_peers"] = len(peers)
         
         return attrs
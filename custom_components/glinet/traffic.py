@@ -0,0 +1,148 @@
+"""Per-client traffic accounting and top talkers for GL.iNet routers."""
+import heapq
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional
+
+# Traffic is accumulated in buckets of this many seconds
+TRAFFIC_BUCKET_SECONDS = 60
+
+
+class _ClientTraffic:
+    """Traffic history of a single client."""
+
+    __slots__ = ("name", "ip", "rx_total", "tx_total", "sampled_at", "buckets", "sums")
+
+    def __init__(self, window_count: int) -> None:
+        self.name: Optional[str] = None
+        self.ip: Optional[str] = None
+        self.rx_total: Optional[float] = None
+        self.tx_total: Optional[float] = None
+        self.sampled_at: Optional[float] = None
+        # One deque of [bucket, rx, tx] and one [rx, tx] running sum per window
+        self.buckets: List[Deque[List[float]]] = [deque() for _ in range(window_count)]
+        self.sums: List[List[float]] = [[0.0, 0.0] for _ in range(window_count)]
+
+
+class ClientTrafficTracker:
+    """Sliding-window traffic totals per client MAC, with top-K queries.
+
+    Client records carry either cumulative ``total_rx``/``total_tx`` byte
+    counters or current ``rx``/``tx`` speeds depending on firmware; whichever
+    is present is turned into bytes transferred since the last refresh.
+    Window sums are maintained incrementally, so a refresh is O(N) and a
+    top-K query O(N log K).
+    """
+
+    def __init__(self, windows: Dict[str, int]) -> None:
+        """Initialize the tracker with named windows in seconds."""
+        self.windows = dict(windows)
+        self._window_names = list(self.windows)
+        self._window_buckets = [
+            max(1, seconds // TRAFFIC_BUCKET_SECONDS) for seconds in self.windows.values()
+        ]
+        self._clients: Dict[str, _ClientTraffic] = {}
+
+    def __len__(self) -> int:
+        """Return the number of tracked clients."""
+        return len(self._clients)
+
+    def update(self, clients: Iterable[Dict[str, Any]], now: float) -> None:
+        """Account the traffic reported by one client list refresh."""
+        bucket = int(now // TRAFFIC_BUCKET_SECONDS)
+        seen = set()
+
+        for client in clients:
+            mac = client.get("mac")
+            if not mac:
+                continue
+            mac = mac.upper()
+            seen.add(mac)
+
+            traffic = self._clients.get(mac)
+            if traffic is None:
+                traffic = self._clients[mac] = _ClientTraffic(len(self.windows))
+            traffic.name = client.get("name") or traffic.name
+            traffic.ip = client.get("ip") or traffic.ip
+
+            rx_delta, tx_delta = self._deltas(traffic, client, now)
+            traffic.sampled_at = now
+            if rx_delta or tx_delta:
+                self._add(traffic, bucket, rx_delta, tx_delta)
+
+        for mac in list(self._clients):
+            traffic = self._clients[mac]
+            self._expire(traffic, bucket)
+            if mac not in seen:
+                # Start over on return, rather than crediting the offline gap
+                traffic.rx_total = traffic.tx_total = traffic.sampled_at = None
+                if not any(traffic.buckets):
+                    del self._clients[mac]
+
+    def top(self, window: str, count: int) -> List[Dict[str, Any]]:
+        """Return the ``count`` clients with the most traffic in ``window``."""
+        position = self._window_names.index(window)
+        seconds = self.windows[window]
+        talkers = heapq.nlargest(
+            count,
+            self._clients.items(),
+            key=lambda item: item[1].sums[position][0] + item[1].sums[position][1],
+        )
+
+        result = []
+        for mac, traffic in talkers:
+            rx_bytes, tx_bytes = traffic.sums[position]
+            if not rx_bytes and not tx_bytes:
+                break
+            result.append({
+                "mac": mac,
+                "name": traffic.name,
+                "ip": traffic.ip,
+                "rx_bytes": round(rx_bytes),
+                "tx_bytes": round(tx_bytes),
+                "total_bytes": round(rx_bytes + tx_bytes),
+                "rx_rate": round(rx_bytes / seconds),
+                "tx_rate": round(tx_bytes / seconds),
+            })
+        return result
+
+    @staticmethod
+    def _deltas(traffic: _ClientTraffic, client: Dict[str, Any], now: float) -> tuple:
+        """Return the bytes a client transferred since its last sample."""
+        if "total_rx" in client or "total_tx" in client:
+            rx_total = float(client.get("total_rx") or 0)
+            tx_total = float(client.get("total_tx") or 0)
+            previous_rx, previous_tx = traffic.rx_total, traffic.tx_total
+            traffic.rx_total, traffic.tx_total = rx_total, tx_total
+            if previous_rx is None:
+                return 0.0, 0.0
+            # Counters restart when the client reconnects
+            rx_delta = rx_total - previous_rx if rx_total >= previous_rx else rx_total
+            tx_delta = tx_total - previous_tx if tx_total >= previous_tx else tx_total
+            return rx_delta, tx_delta
+
+        if traffic.sampled_at is None:
+            return 0.0, 0.0
+        elapsed = now - traffic.sampled_at
+        return float(client.get("rx") or 0) * elapsed, float(client.get("tx") or 0) * elapsed
+
+    def _add(self, traffic: _ClientTraffic, bucket: int, rx_delta: float, tx_delta: float) -> None:
+        """Add transferred bytes to every window of a client."""
+        for buckets, sums in zip(traffic.buckets, traffic.sums):
+            if buckets and buckets[-1][0] == bucket:
+                buckets[-1][1] += rx_delta
+                buckets[-1][2] += tx_delta
+            else:
+                buckets.append([bucket, rx_delta, tx_delta])
+            sums[0] += rx_delta
+            sums[1] += tx_delta
+
+    def _expire(self, traffic: _ClientTraffic, bucket: int) -> None:
+        """Drop buckets that have slid out of each window."""
+        for buckets, sums, length in zip(traffic.buckets, traffic.sums, self._window_buckets):
+            oldest = bucket - length
+            while buckets and buckets[0][0] <= oldest:
+                _, rx_bytes, tx_bytes = buckets.popleft()
+                sums[0] -= rx_bytes
+                sums[1] -= tx_bytes
+            if not buckets:
+                sums[0] = sums[1] = 0.0
@@ -0,0 +1,218 @@
+"""Websocket commands serving the client, firewall and WireGuard peer tables.
+
+The tables are read from the coordinator indexes instead of entity
+attributes, so they are only serialized when a frontend card asks for them.
+Each table has a paged ``glinet/<table>`` command and a
+``glinet/<table>/subscribe`` command that sends the filtered table once and
+then only the rows that changed after each refresh. The tables hold
+client MACs, firewall rules and VPN peer addresses, so only admins may
+read them.
+"""
+import logging
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+import voluptuous as vol
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN, WEBSOCKET_MAX_PAGE_SIZE, WEBSOCKET_PAGE_SIZE
+from .coordinator import GLiNetDataUpdateCoordinator
+from .records import Record
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_WEBSOCKET = f"{DOMAIN}_websocket"
+
+Rows = Dict[str, Dict[str, Any]]
+Filter = Callable[[Dict[str, Any]], bool]
+
+
+def _firewall_index(coordinator: GLiNetDataUpdateCoordinator) -> Rows:
+    """Return firewall rules and port forwards keyed by type and rule id."""
+    rows = {}
+    for rule_type, index in (
+        ("rule", coordinator.firewall_rule_index),
+        ("port_forward", coordinator.port_forward_index),
+    ):
+        for rule_id, rule in index.items():
+            rows[f"{rule_type}:{rule_id}"] = {**rule, "type": rule_type}
+    return rows
+
+
+class Table(NamedTuple):
+    """A table served over the websocket API."""
+
+    index: Callable[[GLiNetDataUpdateCoordinator], Dict[str, Any]]
+    to_row: Callable[[Any], Dict[str, Any]]
+    # Keys that changed in the last refresh, or None when the whole table has
+    # to be compared against what was sent before
+    changes: Optional[Callable[[GLiNetDataUpdateCoordinator], Set[str]]]
+    filters: Dict[vol.Marker, Any]
+
+
+TABLES = {
+    "clients": Table(
+        lambda coordinator: coordinator.client_index,
+        Record.as_dict,
+        lambda coordinator: coordinator.client_changes,
+        {vol.Optional("online"): bool, vol.Optional("iface"): str},
+    ),
+    "firewall_rules": Table(
+        _firewall_index,
+        dict,
+        None,
+        {vol.Optional("type"): vol.In(["rule", "port_forward"])},
+    ),
+    "peers": Table(
+        lambda coordinator: coordinator.wg_peer_index,
+        Record.as_dict,
+        lambda coordinator: coordinator.wg_peer_changes,
+        {vol.Optional("connected"): bool},
+    ),
+}
+
+# Filter fields matched against the row field of the same name
+FIELD_FILTERS = ("online", "iface", "type", "connected")
+
+
+def build_filter(msg: Dict[str, Any]) -> Filter:
+    """Return a row predicate for the filters given in a command."""
+    fields = {field: msg[field] for field in FIELD_FILTERS if field in msg}
+    search = (msg.get("search") or "").lower()
+
+    def matches(row: Dict[str, Any]) -> bool:
+        if any(row.get(field) != value for field, value in fields.items()):
+            return False
+        if search:
+            return any(
+                search in value.lower() for value in row.values() if isinstance(value, str)
+            )
+        return True
+
+    return matches
+
+
+def filter_rows(table: Table, index: Dict[str, Any], matches: Filter) -> List[Tuple[str, Dict[str, Any]]]:
+    """Return the matching rows sorted by key, so pages are stable."""
+    rows = ((key, table.to_row(value)) for key, value in sorted(index.items(), key=lambda item: item[0]))
+    return [(key, row) for key, row in rows if matches(row)]
+
+
+def _get_coordinator(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: Dict[str, Any]
+) -> Optional[GLiNetDataUpdateCoordinator]:
+    """Return the coordinator of the requested entry, or send an error."""
+    coordinator = hass.data.get(DOMAIN, {}).get(msg["entry_id"])
+    if coordinator is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, f"No loaded router {msg['entry_id']}"
+        )
+    return coordinator
+
+
+def _make_get_command(name: str, table: Table) -> Callable:
+    """Build the paged read command of a table."""
+
+    @websocket_api.websocket_command(
+        {
+            vol.Required("type"): f"{DOMAIN}/{name}",
+            vol.Required("entry_id"): str,
+            vol.Optional("offset", default=0): vol.All(vol.Coerce(int), vol.Range(min=0)),
+            vol.Optional("limit", default=WEBSOCKET_PAGE_SIZE): vol.All(
+                vol.Coerce(int), vol.Range(min=1, max=WEBSOCKET_MAX_PAGE_SIZE)
+            ),
+            vol.Optional("search"): str,
+            **table.filters,
+        }
+    )
+    @websocket_api.require_admin
+    @callback
+    def handle_get(
+        hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: Dict[str, Any]
+    ) -> None:
+        """Send one page of a table."""
+        coordinator = _get_coordinator(hass, connection, msg)
+        if coordinator is None:
+            return
+        rows = filter_rows(table, table.index(coordinator), build_filter(msg))
+        offset, limit = msg["offset"], msg["limit"]
+        connection.send_result(
+            msg["id"],
+            {
+                "total": len(rows),
+                "offset": offset,
+                "limit": limit,
+                "items": [{"key": key, **row} for key, row in rows[offset:offset + limit]],
+            },
+        )
+
+    return handle_get
+
+
+def _make_subscribe_command(name: str, table: Table) -> Callable:
+    """Build the diff subscription command of a table."""
+
+    @websocket_api.websocket_command(
+        {
+            vol.Required("type"): f"{DOMAIN}/{name}/subscribe",
+            vol.Required("entry_id"): str,
+            vol.Optional("search"): str,
+            **table.filters,
+        }
+    )
+    @websocket_api.require_admin
+    @callback
+    def handle_subscribe(
+        hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: Dict[str, Any]
+    ) -> None:
+        """Send the filtered table, then the rows that change after each refresh."""
+        coordinator = _get_coordinator(hass, connection, msg)
+        if coordinator is None:
+            return
+        matches = build_filter(msg)
+        sent = dict(filter_rows(table, table.index(coordinator), matches))
+
+        @callback
+        def send_changes() -> None:
+            index = table.index(coordinator)
+            if table.changes is not None:
+                # The change set also holds the keys of removed rows
+                keys: Iterable[str] = table.changes(coordinator)
+            else:
+                keys = index.keys() | sent.keys()
+            upserted = []
+            removed = []
+            for key in keys:
+                value = index.get(key)
+                row = table.to_row(value) if value is not None else None
+                if row is not None and matches(row):
+                    if sent.get(key) != row:
+                        sent[key] = row
+                        upserted.append({"key": key, **row})
+                elif sent.pop(key, None) is not None:
+                    removed.append(key)
+            if upserted or removed:
+                connection.send_message(
+                    websocket_api.event_message(msg["id"], {"upserted": upserted, "removed": removed})
+                )
+
+        connection.subscriptions[msg["id"]] = coordinator.async_add_listener(send_changes)
+        connection.send_result(msg["id"])
+        connection.send_message(
+            websocket_api.event_message(
+                msg["id"], {"upserted": [{"key": key, **row} for key, row in sent.items()], "removed": []}
+            )
+        )
+
+    return handle_subscribe
+
+
+@callback
+def async_register_websocket_commands(hass: HomeAssistant) -> None:
+    """Register the table commands once for all routers."""
+    if hass.data.get(DATA_WEBSOCKET):
+        return
+    hass.data[DATA_WEBSOCKET] = True
+    for name, table in TABLES.items():
+        websocket_api.async_register_command(hass, _make_get_command(name, table))
+        websocket_api.async_register_command(hass, _make_subscribe_command(name, table))
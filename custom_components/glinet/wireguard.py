@@ -0,0 +1,235 @@
+"""WireGuard server peer entities for GL.iNet routers."""
+import logging
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.components.switch import SwitchEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import UnitOfDataRate, UnitOfInformation
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN, MANUFACTURER
+from .coordinator import GLiNetDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+WG_PEER_SENSOR_DESCRIPTIONS = [
+    SensorEntityDescription(
+        key="status",
+        name="Status",
+        icon="mdi:account-network",
+    ),
+    SensorEntityDescription(
+        key="latest_handshake",
+        name="Last Handshake",
+        icon="mdi:handshake",
+        device_class=SensorDeviceClass.TIMESTAMP,
+    ),
+    SensorEntityDescription(
+        key="rx_bytes",
+        name="Received",
+        icon="mdi:download-network",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    SensorEntityDescription(
+        key="tx_bytes",
+        name="Sent",
+        icon="mdi:upload-network",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    SensorEntityDescription(
+        key="rx_rate",
+        name="Download Rate",
+        icon="mdi:download-network",
+        device_class=SensorDeviceClass.DATA_RATE,
+        native_unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="tx_rate",
+        name="Upload Rate",
+        icon="mdi:upload-network",
+        device_class=SensorDeviceClass.DATA_RATE,
+        native_unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+]
+
+
+class GLiNetWGPeerEntity(Entity):
+    """Base class for entities backed by a row of the WireGuard peer table.
+
+    These are not coordinator entities: the peer manager writes state only
+    for the peers that changed in the last update.
+    """
+
+    _attr_should_poll = False
+
+    def __init__(self, coordinator: GLiNetDataUpdateCoordinator, peer_id: str) -> None:
+        """Initialize the peer entity."""
+        self.coordinator = coordinator
+        self.peer_id = peer_id
+        entry = coordinator.config_entry
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, entry.entry_id)},
+            "name": entry.title,
+            "manufacturer": MANUFACTURER,
+            "model": coordinator.data.get("system_info", {}).get("model", "Unknown"),
+            "sw_version": coordinator.data.get("system_info", {}).get("firmware_version", "Unknown"),
+        }
+
+    @property
+    def peer(self) -> Dict[str, Any]:
+        """Return the peer record from the coordinator table."""
+        return self.coordinator.wg_peer_index.get(self.peer_id) or {}
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return self.coordinator.last_update_success and self.peer_id in self.coordinator.wg_peer_index
+
+
+class GLiNetWGPeerSensor(GLiNetWGPeerEntity, SensorEntity):
+    """Sensor for a single WireGuard server peer."""
+
+    def __init__(
+        self,
+        coordinator: GLiNetDataUpdateCoordinator,
+        peer_id: str,
+        description: SensorEntityDescription,
+    ) -> None:
+        """Initialize the peer sensor."""
+        super().__init__(coordinator, peer_id)
+        self.entity_description = description
+        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_wg_peer_{peer_id}_{description.key}"
+        self._attr_name = f"WireGuard Peer {self.peer.get('name', peer_id)} {description.name}"
+
+    @property
+    def native_value(self) -> Any:
+        """Return the state of the sensor."""
+        peer = self.peer
+        key = self.entity_description.key
+
+        if key == "status":
+            return "Connected" if peer.get("connected") else "Disconnected"
+
+        elif key == "latest_handshake":
+            handshake = peer.get("latest_handshake")
+            if not handshake:
+                return None
+            return datetime.fromtimestamp(handshake, tz=timezone.utc)
+
+        return peer.get(key)
+
+
+class GLiNetWGPeerSwitch(GLiNetWGPeerEntity, SwitchEntity):
+    """Switch to enable or disable a WireGuard server peer."""
+
+    def __init__(self, coordinator: GLiNetDataUpdateCoordinator, peer_id: str) -> None:
+        """Initialize the peer switch."""
+        super().__init__(coordinator, peer_id)
+        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_wg_peer_{peer_id}"
+        self._attr_name = f"WireGuard Peer {self.peer.get('name', peer_id)}"
+        self._attr_icon = "mdi:account-network"
+
+    @property
+    def is_on(self) -> bool:
+        """Return true if the peer is enabled."""
+        return bool(self.peer.get("enabled"))
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        """Return the state attributes."""
+        peer = self.peer
+        return {
+            "peer_id": self.peer_id,
+            "private_ip": peer.get("private_ip"),
+            "public_ip": peer.get("public_ip"),
+        }
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        """Enable the peer."""
+        if not await self.coordinator.async_set_wg_peer_enabled(self.peer_id, True):
+            _LOGGER.error("Failed to enable WireGuard peer: %s", self.peer_id)
+
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        """Disable the peer."""
+        if not await self.coordinator.async_set_wg_peer_enabled(self.peer_id, False):
+            _LOGGER.error("Failed to disable WireGuard peer: %s", self.peer_id)
+
+
+@callback
+def async_setup_wg_peer_entities(
+    hass: HomeAssistant,
+    coordinator: GLiNetDataUpdateCoordinator,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+    factory: Callable[[GLiNetDataUpdateCoordinator, str], List[GLiNetWGPeerEntity]],
+) -> None:
+    """Keep one set of peer entities per WireGuard peer, writing only changed peers."""
+    tracked: Dict[str, List[GLiNetWGPeerEntity]] = {}
+    last_available: List[Optional[bool]] = [None]
+
+    @callback
+    def update_peers() -> None:
+        """Sync tracked peers with the coordinator peer table."""
+        index = coordinator.wg_peer_index
+        available = coordinator.last_update_success
+
+        new_entities = []
+        for peer_id in index.keys() - tracked.keys():
+            entities = factory(coordinator, peer_id)
+            tracked[peer_id] = entities
+            new_entities.extend(entities)
+
+        registry = er.async_get(hass)
+        for peer_id in tracked.keys() - index.keys():
+            for entity in tracked.pop(peer_id):
+                if entity.entity_id and registry.async_get(entity.entity_id):
+                    registry.async_remove(entity.entity_id)
+                elif entity.hass:
+                    hass.async_create_task(entity.async_remove())
+
+        # Availability changes touch every peer, otherwise only the changed ones
+        if available != last_available[0]:
+            to_write = tracked.keys()
+            last_available[0] = available
+        else:
+            to_write = coordinator.wg_peer_changes & tracked.keys()
+
+        for peer_id in to_write:
+            for entity in tracked[peer_id]:
+                if entity.hass:
+                    entity.async_write_ha_state()
+
+        if new_entities:
+            async_add_entities(new_entities)
+
+    entry.async_on_unload(coordinator.async_add_listener(update_peers))
+    update_peers()
+
+
+def wg_peer_sensors(coordinator: GLiNetDataUpdateCoordinator, peer_id: str) -> List[GLiNetWGPeerEntity]:
+    """Build the sensors for one WireGuard peer."""
+    return [
+        GLiNetWGPeerSensor(coordinator, peer_id, description)
+        for description in WG_PEER_SENSOR_DESCRIPTIONS
+    ]
+
+
+def wg_peer_switches(coordinator: GLiNetDataUpdateCoordinator, peer_id: str) -> List[GLiNetWGPeerEntity]:
+    """Build the enable switch for one WireGuard peer."""
+    return [GLiNetWGPeerSwitch(coordinator, peer_id)]
@@ -0,0 +1,50 @@
+"""Time decoding a clients.get_list response with orjson versus the stdlib.
+
+Run from the repository root with ``python scripts/benchmark_decode.py``.
+Pass the path of a recorded response body to time that instead of a
+synthetic one, e.g. a body saved from the router with::
+
+    curl -s -d '{"jsonrpc":"2.0","id":1,"method":"call",
+      "params":["<sid>","clients","get_list",{}]}' http://192.168.8.1/rpc > clients.json
+"""
+import json
+import sys
+import timeit
+from pathlib import Path
+
+from benchmark_records import client_list_json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def best_of(func, number: int) -> float:
+    """Return the fastest time of one call over five runs of ``number`` calls."""
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+def main() -> None:
+    """Print the decode time of each library."""
+    if len(sys.argv) > 1:
+        payload = Path(sys.argv[1]).read_bytes()
+        source = sys.argv[1]
+    else:
+        payload = client_list_json(500)
+        source = "synthetic, 500 clients"
+    number = 200
+
+    print(f"{source}: {len(payload) / 1024:.1f} KiB")
+    stdlib = best_of(lambda: json.loads(payload), number)
+    print(f"  json.loads:    {stdlib * 1000:8.3f} ms")
+    if orjson is None:
+        print("  orjson.loads:  not installed")
+        return
+    assert orjson.loads(payload) == json.loads(payload)
+    fast = best_of(lambda: orjson.loads(payload), number)
+    print(f"  orjson.loads:  {fast * 1000:8.3f} ms ({stdlib / fast:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
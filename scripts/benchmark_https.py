@@ -0,0 +1,75 @@
+"""Compare RPC latency to a router over HTTP and over HTTPS.
+
+This needs a real router on the network, so no figures ship with the repo.
+Run from the repository root with ``requests`` installed::
+
+    python scripts/benchmark_https.py 192.168.8.1 root <password> [calls]
+
+Both schemes log in with the integration's own client, HTTPS with the
+router certificate pinned as the integration pins it. The first call of
+each scheme opens the connection, so for HTTPS it includes the TLS
+handshake; the remaining calls reuse the kept-alive connection.
+"""
+import importlib.util
+import statistics
+import sys
+import time
+from pathlib import Path
+
+PACKAGE_PATH = Path(__file__).resolve().parent.parent / "custom_components" / "glinet"
+
+STATUS_CALL = {"jsonrpc": "2.0", "method": "call", "params": [None, "system", "get_status", {}], "id": 1}
+
+
+def load_api():
+    """Import api.py and its helpers without the Home Assistant parts of the package."""
+    spec = importlib.util.spec_from_file_location(
+        "glinet", PACKAGE_PATH / "__init__.py", submodule_search_locations=[str(PACKAGE_PATH)]
+    )
+    # Register the package without running __init__.py, which needs Home Assistant
+    sys.modules["glinet"] = importlib.util.module_from_spec(spec)
+    return importlib.import_module("glinet.api")
+
+
+def time_calls(api, json_loads, calls: int) -> list:
+    """Return the milliseconds of each system.get_status round trip, decode included."""
+    payload = {**STATUS_CALL, "params": [api.sid, *STATUS_CALL["params"][1:]]}
+    durations = []
+    for _ in range(calls):
+        started = time.perf_counter()
+        response = api._post(payload)
+        response.raise_for_status()
+        json_loads(response.content)
+        durations.append((time.perf_counter() - started) * 1000)
+    return durations
+
+
+def main() -> None:
+    """Print the connection and steady-state latency of each scheme."""
+    if len(sys.argv) < 4:
+        sys.exit(__doc__)
+    host, username, password = sys.argv[1:4]
+    calls = int(sys.argv[4]) if len(sys.argv) > 4 else 50
+    api_module = load_api()
+
+    fingerprint = api_module.fetch_certificate_fingerprint(host)
+    for scheme, kwargs in (
+        ("http", {}),
+        ("https", {"use_https": True, "cert_fingerprint": fingerprint}),
+    ):
+        api = api_module.GLiNetAPI(host, username, password, **kwargs)
+        if not api.authenticate():
+            sys.exit(f"{scheme}: login failed")
+        # Drop the login connection, so the first timed call opens its own
+        api.session.close()
+        durations = time_calls(api, api_module.json_loads, calls + 1)
+        first, rest = durations[0], sorted(durations[1:])
+        print(
+            f"{scheme:5}  first call {first:7.1f} ms  "
+            f"median {statistics.median(rest):6.1f} ms  "
+            f"p95 {rest[int(len(rest) * 0.95) - 1]:6.1f} ms  ({calls} calls)"
+        )
+
+
+if __name__ == "__main__":
+    main()
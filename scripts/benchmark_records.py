@@ -0,0 +1,83 @@
+"""Measure the memory of client lists as JSON dicts versus slotted records.
+
+Run from the repository root with ``python scripts/benchmark_records.py``.
+Only records.py is loaded, so Home Assistant does not need to be installed.
+"""
+import importlib.util
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+
+RECORDS_PATH = Path(__file__).resolve().parent.parent / "custom_components" / "glinet" / "records.py"
+
+
+def load_records():
+    """Import records.py on its own, without the integration package."""
+    spec = importlib.util.spec_from_file_location("glinet_records", RECORDS_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def client_list_json(count: int) -> bytes:
+    """Return a clients.get_list style response with ``count`` clients."""
+    clients = []
+    for i in range(count):
+        clients.append({
+            "mac": f"aa:bb:cc:{i >> 16 & 255:02x}:{i >> 8 & 255:02x}:{i & 255:02x}",
+            "name": f"client-{i}",
+            "ip": f"192.168.{i >> 8 & 255}.{i & 255}",
+            "iface": "2.4G" if i % 2 else "5G",
+            "online": True,
+            "remote": False,
+            "vendor": "Example Vendor Inc.",
+            "total_rx": i * 1000,
+            "total_tx": i * 500,
+            "rx": 0,
+            "tx": 0,
+            # Fields the integration never reads
+            "alias": "",
+            "blocked": False,
+            "type": 0,
+            "online_time": 12345,
+            "qos_upload": 0,
+            "qos_download": 0,
+            "node_mac": "",
+        })
+    return json.dumps({"clients": clients}).encode()
+
+
+def measure(func):
+    """Return the result of ``func`` and the bytes it left allocated."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = func()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def main() -> None:
+    """Print the retained memory of each representation."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    records = load_records()
+    payload = client_list_json(count)
+
+    dicts, dict_bytes = measure(lambda: json.loads(payload)["clients"])
+    index, record_bytes = measure(
+        lambda: records.merge_records({}, json.loads(payload)["clients"], records.ClientRecord, records.client_key)[0]
+    )
+    (merged, changed), merge_bytes = measure(
+        lambda: records.merge_records(index, json.loads(payload)["clients"], records.ClientRecord, records.client_key)
+    )
+
+    print(f"{count} clients")
+    print(f"  JSON-decoded dicts:        {dict_bytes / 1024:8.1f} KiB")
+    print(f"  slotted records:           {record_bytes / 1024:8.1f} KiB")
+    print(f"  unchanged refresh merged:  {merge_bytes / 1024:8.1f} KiB retained, {len(changed)} changed")
+    assert len(dicts) == len(merged) == count
+
+
+if __name__ == "__main__":
+    main()